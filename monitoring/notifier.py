@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import errno
+import functools
 import json
 import logging
 import os
+import queue
 import tempfile
+import threading
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from urllib.parse import urlencode
 
@@ -18,6 +23,20 @@ from .storage import StateStore
 
 logger = logging.getLogger(__name__)
 
+# /status runs the whole check suite, so it is served by a background worker
+# instead of blocking update ingestion in _poll_telegram_updates. The worker is
+# a non-daemon thread that exits once the queue is drained, so a short-lived
+# monitor process still delivers the replies before the interpreter exits.
+_STATUS_QUEUE: "queue.Queue[Tuple[Config, str, str]]" = queue.Queue()
+_STATUS_WORKER: Optional[threading.Thread] = None
+_STATUS_WORKER_LOCK = threading.Lock()
+
+# Upper bound for parallel sendMessage requests when fanning out an alert.
+_MAX_BROADCAST_WORKERS = 8
+
+# Parent directories already created by _write_subscriber_state.
+_ENSURED_DIRS: Set[Path] = set()
+
 
 def _send_telegram_payload(
     config: Config,
@@ -65,6 +84,29 @@ def _send_telegram_message(
     _send_telegram_payload(config, token, payload, timeout=timeout)
 
 
+def _broadcast_telegram_message(
+    config: Config,
+    token: str,
+    chat_ids: List[str],
+    text: str,
+    *,
+    timeout: float,
+) -> None:
+    if len(chat_ids) <= 1:
+        for chat_id in chat_ids:
+            _send_telegram_message(config, token, chat_id, text, timeout=timeout)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_BROADCAST_WORKERS, len(chat_ids))) as executor:
+        futures = [
+            executor.submit(_send_telegram_message, config, token, chat_id, text, timeout=timeout)
+            for chat_id in chat_ids
+        ]
+    # Every chat gets its attempt; the first failure is reported afterwards.
+    for future in futures:
+        future.result()
+
+
 def _format_container_names(config: Config) -> Optional[str]:
     if not config.app_checks:
         return None
@@ -154,6 +196,7 @@ def _sync_subscriber_store(
 
     subscriber_path = Path(tg_cfg.subscriber_store)
     subscribers, last_update_id = _load_subscriber_state(subscriber_path)
+    stored_state = (frozenset(subscribers), last_update_id)
     new_chat_ids: Set[str] = set()
     if allow_poll and tg_cfg.poll_updates:
         subscribers, last_update_id, new_chat_ids = _poll_telegram_updates(
@@ -165,13 +208,15 @@ def _sync_subscriber_store(
         if new_chat_ids:
             _welcome_new_subscribers(config, token, new_chat_ids, timeout=tg_cfg.request_timeout)
 
-    _write_subscriber_state(subscriber_path, subscribers, last_update_id)
+    # Steady state (no new subscribers, no new updates) must not touch the disk.
+    if (frozenset(subscribers), last_update_id) != stored_state:
+        _write_subscriber_state(subscriber_path, subscribers, last_update_id)
     sorted_ids = sorted(subscribers)
     return sorted_ids, last_update_id
 
 
-def _unique(sequence: Iterable[str]) -> List[str]:
-    return list(dict.fromkeys(sequence))
+def _unique(*sequences: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(chain.from_iterable(sequences)))
 
 
 def _load_subscriber_state(path: Path) -> Tuple[Set[str], Optional[int]]:
@@ -198,7 +243,9 @@ def _write_subscriber_state(path: Path, chat_ids: Set[str], last_update_id: Opti
         "chat_ids": sorted(chat_ids),
         "last_update_id": last_update_id,
     }
-    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.parent not in _ENSURED_DIRS:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path.parent)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
     tmp_path.replace(path)
@@ -251,21 +298,52 @@ def _poll_telegram_updates(
             continue
         chat_id_str = str(chat_id)
         logger.info("Processing update %s from chat %s: '%s'", update_id, chat_id_str, text)
-        
-        if text == "/start" and chat.get("type") == "private":
-            if chat_id_str not in chat_ids:
-                new_chat_ids.add(chat_id_str)
-            chat_ids.add(chat_id_str)
-        elif text == "/status" and chat_id_str in chat_ids:
-            # Handle /status command for subscribed users
-            _handle_status_command(config, token, chat_id_str)
-        elif text == "/help" and chat_id_str in chat_ids:
-            # Handle /help command for subscribed users
-            _handle_help_command(config, token, chat_id_str)
+
+        if not text:
+            continue
+        handler = _COMMANDS.get(text.split(maxsplit=1)[0])
+        if handler is not None:
+            handler(config, token, chat, chat_id_str, chat_ids, new_chat_ids)
 
     return chat_ids, max_update_id, new_chat_ids
 
 
+_CommandHandler = Callable[[Config, str, dict, str, Set[str], Set[str]], None]
+
+
+def _on_start(
+    config: Config, token: str, chat: dict, chat_id: str, chat_ids: Set[str], new_chat_ids: Set[str]
+) -> None:
+    if chat.get("type") != "private":
+        return
+    if chat_id not in chat_ids:
+        new_chat_ids.add(chat_id)
+    chat_ids.add(chat_id)
+
+
+def _on_status(
+    config: Config, token: str, chat: dict, chat_id: str, chat_ids: Set[str], new_chat_ids: Set[str]
+) -> None:
+    # Handle /status command for subscribed users
+    if chat_id in chat_ids:
+        _enqueue_status_command(config, token, chat_id)
+
+
+def _on_help(
+    config: Config, token: str, chat: dict, chat_id: str, chat_ids: Set[str], new_chat_ids: Set[str]
+) -> None:
+    # Handle /help command for subscribed users
+    if chat_id in chat_ids:
+        _handle_help_command(config, token, chat_id)
+
+
+_COMMANDS: Dict[str, _CommandHandler] = {
+    "/start": _on_start,
+    "/status": _on_status,
+    "/help": _on_help,
+}
+
+
 def _fallback_state_path() -> Path:
     override = os.environ.get("SPONDEX_MONITOR_STATE_DIR")
     if override:
@@ -282,9 +360,15 @@ def _fallback_state_path() -> Path:
     return Path(tempfile.gettempdir()) / "spondex-monitor" / "bot-state.db"
 
 
+@functools.lru_cache(maxsize=4)
+def _get_state_store(path: Path) -> StateStore:
+    # Opening a store runs the schema script and migration check; do it once per path.
+    return StateStore(path)
+
+
 def _open_state_store(config: Config) -> StateStore:
     try:
-        return StateStore(config.state_path)
+        return _get_state_store(config.state_path)
     except OSError as exc:
         if not isinstance(exc, PermissionError) and exc.errno not in (errno.EACCES, errno.EROFS):
             raise
@@ -309,7 +393,7 @@ def _open_state_store(config: Config) -> StateStore:
             fallback_path,
         )
         try:
-            return StateStore(fallback_path)
+            return _get_state_store(fallback_path)
         except Exception as fallback_exc:  # pragma: no cover
             logger.error(
                 "Failed to open fallback monitoring state at %s: %s",
@@ -319,6 +403,35 @@ def _open_state_store(config: Config) -> StateStore:
             raise
 
 
+def _status_worker() -> None:
+    global _STATUS_WORKER
+    while True:
+        # Deciding to exit under the lock means _enqueue_status_command either
+        # sees this worker alive with the item queued, or starts a new one.
+        with _STATUS_WORKER_LOCK:
+            try:
+                config, token, chat_id = _STATUS_QUEUE.get_nowait()
+            except queue.Empty:
+                _STATUS_WORKER = None
+                return
+        try:
+            _handle_status_command(config, token, chat_id)
+        finally:
+            _STATUS_QUEUE.task_done()
+
+
+def _enqueue_status_command(config: Config, token: str, chat_id: str) -> None:
+    global _STATUS_WORKER
+    with _STATUS_WORKER_LOCK:
+        _STATUS_QUEUE.put((config, token, chat_id))
+        if _STATUS_WORKER is None:
+            _STATUS_WORKER = threading.Thread(
+                target=_status_worker,
+                name="telegram-status-worker",
+            )
+            _STATUS_WORKER.start()
+
+
 def _handle_status_command(config: Config, token: str, chat_id: str) -> None:
     """Handle /status command by sending current metrics to the user."""
     logger.info("Handling /status command for chat %s", chat_id)
@@ -333,7 +446,10 @@ def _handle_status_command(config: Config, token: str, chat_id: str) -> None:
         ctx = CheckContext(config=config, store=store, now=now)
 
         metrics, alerts = run_checks(ctx)
-        
+        # The checks already ran; keep their readings like a regular monitor run.
+        if metrics:
+            store.save_metrics(metrics)
+
         # Format report
         report = format_report(now, alerts, metrics)
         
@@ -419,19 +535,18 @@ def send_alert_telegram(config: Config, alerts: list[Alert], body: str, *, force
 
     subscriber_chat_ids, _ = _sync_subscriber_store(config, token, allow_poll=True)
 
-    chat_id_candidates = _unique(list(tg_cfg.chat_ids) + subscriber_chat_ids)
+    chat_id_candidates = _unique(tg_cfg.chat_ids, subscriber_chat_ids)
     if not chat_id_candidates:
         # No subscribers - not an error, just nothing to send
         return False
 
-    for chat_id in chat_id_candidates:
-        _send_telegram_message(
-            config,
-            token,
-            chat_id,
-            body,
-            timeout=tg_cfg.request_timeout,
-        )
+    _broadcast_telegram_message(
+        config,
+        token,
+        chat_id_candidates,
+        body,
+        timeout=tg_cfg.request_timeout,
+    )
 
     return True
 
@@ -24,8 +24,18 @@ CREATE TABLE IF NOT EXISTS state (
 
 CREATE INDEX IF NOT EXISTS idx_metrics_name_time
     ON metrics (name, recorded_at);
+
+CREATE INDEX IF NOT EXISTS idx_metrics_recorded_at
+    ON metrics (recorded_at);
 """
 
+# Batches above this size are written with multi-row INSERT statements.
+BULK_INSERT_THRESHOLD = 32
+# Rows per multi-row INSERT (3 bound parameters each, well below SQLite limits).
+BULK_INSERT_CHUNK_SIZE = 500
+# Rows removed per DELETE statement when pruning, keeps each write transaction short.
+PRUNE_BATCH_SIZE = 10000
+
 
 @dataclass
 class Metric:
@@ -47,12 +57,17 @@ class StateStore:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with sqlite3.connect(self.path) as conn:
+            # WAL is persistent in the database file; writers then append to the
+            # log instead of rewriting pages, and readers never block them.
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(SCHEMA)
             self._migrate_metrics_value_to_text(conn)
 
     @contextmanager
     def connection(self) -> Iterator[sqlite3.Connection]:
         conn = sqlite3.connect(self.path)
+        # Safe with WAL: a power loss may drop the last commits but never corrupts the file.
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
         finally:
@@ -61,16 +76,32 @@ class StateStore:
     def save_metrics(self, metrics: Iterable[Metric]) -> None:
         items = [(m.name, str(m.value), m.recorded_at.isoformat()) for m in metrics]
         with self.connection() as conn:
-            conn.executemany(
-                "INSERT INTO metrics (name, value, recorded_at) VALUES (?, ?, ?)",
-                items,
-            )
+            if len(items) > BULK_INSERT_THRESHOLD:
+                for start in range(0, len(items), BULK_INSERT_CHUNK_SIZE):
+                    chunk = items[start : start + BULK_INSERT_CHUNK_SIZE]
+                    placeholders = ", ".join(["(?, ?, ?)"] * len(chunk))
+                    conn.execute(
+                        f"INSERT INTO metrics (name, value, recorded_at) VALUES {placeholders}",
+                        [param for row in chunk for param in row],
+                    )
+            else:
+                conn.executemany(
+                    "INSERT INTO metrics (name, value, recorded_at) VALUES (?, ?, ?)",
+                    items,
+                )
             conn.commit()
 
     def prune_metrics_older_than(self, cutoff: datetime) -> None:
         with self.connection() as conn:
-            conn.execute("DELETE FROM metrics WHERE recorded_at < ?", (cutoff.isoformat(),))
-            conn.commit()
+            while True:
+                cursor = conn.execute(
+                    "DELETE FROM metrics WHERE id IN "
+                    "(SELECT id FROM metrics WHERE recorded_at < ? LIMIT ?)",
+                    (cutoff.isoformat(), PRUNE_BATCH_SIZE),
+                )
+                conn.commit()
+                if cursor.rowcount < PRUNE_BATCH_SIZE:
+                    break
 
     def fetch_metric_window(self, name: str, since: datetime) -> list[Metric]:
         with self.connection() as conn:
@@ -78,8 +109,10 @@ class StateStore:
                 "SELECT name, value, recorded_at FROM metrics WHERE name = ? AND recorded_at >= ? ORDER BY recorded_at",
                 (name, since.isoformat()),
             )
-            rows = cursor.fetchall()
-        return [Metric(row[0], str(row[1]), datetime.fromisoformat(row[2])) for row in rows]
+            return [
+                Metric(metric_name, value, datetime.fromisoformat(recorded_at))
+                for metric_name, value, recorded_at in cursor
+            ]
 
     @staticmethod
     def _migrate_metrics_value_to_text(conn: sqlite3.Connection) -> None:
@@ -101,6 +134,8 @@ class StateStore:
                 DROP TABLE metrics_old;
                 CREATE INDEX IF NOT EXISTS idx_metrics_name_time
                     ON metrics (name, recorded_at);
+                CREATE INDEX IF NOT EXISTS idx_metrics_recorded_at
+                    ON metrics (recorded_at);
                 """
             )
             conn.commit()
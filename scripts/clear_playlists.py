@@ -10,25 +10,13 @@ from __future__ import annotations
 import argparse
 import logging
 import os
-from typing import Any, Iterable, List, Sequence
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Callable, Iterable, List
 
 from dotenv import load_dotenv
 
-# Lazy imports for optional services
-try:
-    from yandex_music import Client as YandexClient  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    YandexClient = None  # type: ignore
-
-try:
-    import spotipy  # type: ignore
-    from spotipy.oauth2 import SpotifyOAuth  # type: ignore
-    from spotipy.exceptions import SpotifyException  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    spotipy = None  # type: ignore
-    SpotifyOAuth = None  # type: ignore
-    SpotifyException = Exception  # type: ignore
-
 logger = logging.getLogger("clear_playlists")
 SPOTIFY_SCOPE = (
     "playlist-read-private "
@@ -36,6 +24,11 @@ SPOTIFY_SCOPE = (
     "playlist-modify-private "
     "playlist-modify-public"
 )
+SERVICES = ("yandex", "spotify")
+SPOTIFY_CREDENTIAL_VARS = ("SPOTIPY_CLIENT_ID", "SPOTIPY_CLIENT_SECRET", "SPOTIPY_REDIRECT_URI")
+DEFAULT_CONCURRENCY = 12
+SPOTIFY_PAGE_SIZE = 50
+SPOTIFY_MAX_ATTEMPTS = 3
 
 
 def configure_logging(verbose: bool) -> None:
@@ -77,16 +70,30 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Spotify: keep playlists you do not own (stop at unfollow stage)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of parallel delete requests (default: {DEFAULT_CONCURRENCY})",
+    )
     return parser.parse_args()
 
 
-def iter_chunks(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
-    for idx in range(0, len(items), size):
-        yield items[idx : idx + size]
+def iter_chunks(items: Iterable[str], size: int) -> Iterable[List[str]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
-def clear_yandex_playlists(dry_run: bool, confirm: bool) -> None:
-    if YandexClient is None:
+def clear_yandex_playlists(
+    dry_run: bool,
+    confirm: bool,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    try:
+        from yandex_music import Client as YandexClient  # type: ignore
+        from yandex_music.exceptions import YandexMusicError  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
         logger.error("yandex-music dependency is missing. Install it before running.")
         raise SystemExit(1)
 
@@ -102,15 +109,20 @@ def clear_yandex_playlists(dry_run: bool, confirm: bool) -> None:
 
     logger.debug("Fetching user playlists...")
     playlists = client.users_playlists_list()
-    owned_playlists = [pl for pl in playlists if getattr(pl, "owner", None) and pl.owner.uid == my_uid]
+    owned_playlists = [
+        pl for pl in playlists if (owner := getattr(pl, "owner", None)) is not None and owner.uid == my_uid
+    ]
 
     if not owned_playlists:
         logger.info("Yandex Music: no user-owned playlists found. Nothing to remove.")
         return
 
     logger.info("Yandex Music: %d owned playlists detected.", len(owned_playlists))
-    for pl in owned_playlists:
-        logger.debug("  - %s (kind=%s)", pl.title, pl.kind)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Owned playlists:\n%s",
+            "\n".join(f"  - {pl.title} (kind={pl.kind})" for pl in owned_playlists),
+        )
 
     if dry_run:
         logger.info("Dry-run enabled, skipping actual deletion for Yandex Music.")
@@ -120,38 +132,105 @@ def clear_yandex_playlists(dry_run: bool, confirm: bool) -> None:
         logger.warning("Add --yes flag to confirm Yandex playlist deletion.")
         return
 
-    for pl in owned_playlists:
-        logger.debug("Deleting Yandex playlist '%s' (kind=%s)...", pl.title, pl.kind)
-        client.users_playlists_delete(pl.kind, my_uid)
-
-    logger.info("Yandex Music: removed %d playlists.", len(owned_playlists))
+    failures = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(client.users_playlists_delete, pl.kind, my_uid): pl
+            for pl in owned_playlists
+        }
+        for future in as_completed(futures):
+            pl = futures[future]
+            try:
+                future.result()
+                logger.debug("Deleted Yandex playlist '%s' (kind=%s).", pl.title, pl.kind)
+            except YandexMusicError as exc:  # pragma: no cover - network path
+                failures += 1
+                logger.error("Failed to delete Yandex playlist %s: %s", pl.title, exc)
+
+    successes = len(owned_playlists) - failures
+    logger.info("Yandex Music: removed %d playlists; %d failures.", successes, failures)
+
+
+def call_spotify_with_retry(func: Callable[..., Any], *args: Any) -> Any:
+    """Call a Spotify endpoint, backing off on HTTP 429 as the API asks."""
 
+    from spotipy.exceptions import SpotifyException  # type: ignore
 
-def fetch_spotify_playlists(sp_client: Any) -> List[dict]:
-    playlists: List[dict] = []
-    results = sp_client.current_user_playlists(limit=50)
-    while True:
-        playlists.extend(results["items"])
-        if results["next"]:
-            results = sp_client.next(results)
-        else:
-            break
+    for attempt in range(1, SPOTIFY_MAX_ATTEMPTS + 1):
+        try:
+            return func(*args)
+        except SpotifyException as exc:
+            if getattr(exc, "http_status", None) != 429 or attempt == SPOTIFY_MAX_ATTEMPTS:
+                raise
+            headers = getattr(exc, "headers", None) or {}
+            try:
+                delay = float(headers.get("Retry-After", attempt))
+            except (TypeError, ValueError):
+                delay = float(attempt)
+            logger.warning("Spotify rate limit hit, retrying in %.1f s...", delay)
+            time.sleep(delay)
+    return None  # pragma: no cover - loop always returns or raises
+
+
+def build_spotify_session(pool_size: int) -> Any:
+    """Create a keep-alive session whose pool fits every worker thread."""
+
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+
+    retry = Retry(
+        total=3,
+        read=False,
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_spotify_playlists(sp_client: Any, concurrency: int = 8) -> List[dict]:
+    first_page = sp_client.current_user_playlists(limit=SPOTIFY_PAGE_SIZE, offset=0)
+    playlists: List[dict] = list(first_page["items"])
+    offsets = range(SPOTIFY_PAGE_SIZE, first_page.get("total") or 0, SPOTIFY_PAGE_SIZE)
+    if not offsets:
+        return playlists
+
+    # The first page tells us the total, so the remaining pages can be requested at once.
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(offsets)))) as executor:
+        pages = executor.map(
+            lambda offset: sp_client.current_user_playlists(limit=SPOTIFY_PAGE_SIZE, offset=offset),
+            offsets,
+        )
+        for page in pages:
+            playlists.extend(page["items"])
     return playlists
 
 
-def clear_spotify_playlists(dry_run: bool, confirm: bool, skip_followed: bool) -> None:
-    if spotipy is None or SpotifyOAuth is None:
+def clear_spotify_playlists(
+    dry_run: bool,
+    confirm: bool,
+    skip_followed: bool,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    try:
+        import spotipy  # type: ignore
+        from spotipy.exceptions import SpotifyException  # type: ignore
+        from spotipy.oauth2 import SpotifyOAuth  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
         logger.error("spotipy dependency is missing. Install it before running.")
         raise SystemExit(1)
 
-    client_id = os.getenv("SPOTIPY_CLIENT_ID")
-    client_secret = os.getenv("SPOTIPY_CLIENT_SECRET")
-    redirect_uri = os.getenv("SPOTIPY_REDIRECT_URI")
-
-    if not all([client_id, client_secret, redirect_uri]):
-        logger.error(
-            "Spotify credentials missing (require SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET, SPOTIPY_REDIRECT_URI)."
-        )
+    missing = [name for name in SPOTIFY_CREDENTIAL_VARS if not os.getenv(name)]
+    if missing:
+        logger.error("Spotify credentials missing: %s.", ", ".join(missing))
         return
 
     logger.info("Authenticating with Spotify (may open browser if scopes changed)...")
@@ -160,7 +239,10 @@ def clear_spotify_playlists(dry_run: bool, confirm: bool, skip_followed: bool) -
         cache_path="./.cache",
         open_browser=True,
     )
-    sp = spotipy.Spotify(auth_manager=auth_manager)
+    sp = spotipy.Spotify(
+        auth_manager=auth_manager,
+        requests_session=build_spotify_session(max(DEFAULT_CONCURRENCY, concurrency)),
+    )
     profile = sp.current_user()
     user_id = profile["id"]
 
@@ -168,9 +250,10 @@ def clear_spotify_playlists(dry_run: bool, confirm: bool, skip_followed: bool) -
     playlists = fetch_spotify_playlists(sp)
 
     if skip_followed:
-        owned = [pl for pl in playlists if pl["owner"]["id"] == user_id]
-        removed_targets = owned
-        skipped = [pl for pl in playlists if pl not in owned]
+        removed_targets = []
+        skipped = []
+        for pl in playlists:
+            (removed_targets if pl["owner"]["id"] == user_id else skipped).append(pl)
     else:
         removed_targets = playlists
         skipped = []
@@ -186,9 +269,15 @@ def clear_spotify_playlists(dry_run: bool, confirm: bool, skip_followed: bool) -
         len(removed_targets),
         " (owned only)" if skip_followed else "",
     )
-    for pl in removed_targets:
-        owner_tag = "(owned)" if pl["owner"]["id"] == user_id else f"(owner: {pl['owner']['id']})"
-        logger.debug("  - %s %s", pl["name"], owner_tag)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Playlists to remove:\n%s",
+            "\n".join(
+                f"  - {pl['name']} "
+                + ("(owned)" if pl["owner"]["id"] == user_id else f"(owner: {pl['owner']['id']})")
+                for pl in removed_targets
+            ),
+        )
 
     if skipped:
         logger.info("Spotify: %d playlists skipped (not owned and --skip-followed enabled).", len(skipped))
@@ -202,13 +291,19 @@ def clear_spotify_playlists(dry_run: bool, confirm: bool, skip_followed: bool) -
         return
 
     failures = 0
-    for pl in removed_targets:
-        try:
-            logger.debug("Removing Spotify playlist '%s' (%s)...", pl["name"], pl["id"])
-            sp.current_user_unfollow_playlist(pl["id"])
-        except SpotifyException as exc:  # pragma: no cover - network path
-            failures += 1
-            logger.error("Failed to remove playlist %s: %s", pl["name"], exc)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(call_spotify_with_retry, sp.current_user_unfollow_playlist, pl["id"]): pl
+            for pl in removed_targets
+        }
+        for future in as_completed(futures):
+            pl = futures[future]
+            try:
+                future.result()
+                logger.debug("Removed Spotify playlist '%s' (%s).", pl["name"], pl["id"])
+            except SpotifyException as exc:  # pragma: no cover - network path
+                failures += 1
+                logger.error("Failed to remove playlist %s: %s", pl["name"], exc)
 
     successes = len(removed_targets) - failures
     logger.info("Spotify: successfully removed %d playlists; %d failures.", successes, failures)
@@ -217,26 +312,31 @@ def clear_spotify_playlists(dry_run: bool, confirm: bool, skip_followed: bool) -
 def main() -> None:
     args = parse_args()
     configure_logging(args.verbose)
-    load_dotenv(".env")
 
-    targets: List[str] = []
-    if args.yandex:
-        targets.append("yandex")
-    if args.spotify:
-        targets.append("spotify")
-    if not targets:
-        targets = ["yandex", "spotify"]
+    targets = {service for service in SERVICES if getattr(args, service)} or set(SERVICES)
+    required_vars = [
+        *(("YANDEX_TOKEN",) if "yandex" in targets else ()),
+        *(SPOTIFY_CREDENTIAL_VARS if "spotify" in targets else ()),
+    ]
+    # Docker and CI pass credentials via the environment; read .env only to fill gaps.
+    if not all(os.getenv(name) for name in required_vars):
+        load_dotenv(".env")
 
-    logger.info("Selected services: %s", ", ".join(targets))
+    logger.info("Selected services: %s", ", ".join(s for s in SERVICES if s in targets))
 
     if "yandex" in targets:
-        clear_yandex_playlists(dry_run=args.dry_run, confirm=args.yes)
+        clear_yandex_playlists(
+            dry_run=args.dry_run,
+            confirm=args.yes,
+            concurrency=args.concurrency,
+        )
 
     if "spotify" in targets:
         clear_spotify_playlists(
             dry_run=args.dry_run,
             confirm=args.yes,
             skip_followed=args.skip_followed,
+            concurrency=args.concurrency,
         )
 
 
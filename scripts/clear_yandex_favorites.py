@@ -9,10 +9,14 @@ from __future__ import annotations
 
 import argparse
 import importlib
+import importlib.util
 import logging
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from typing import Iterable, List, TYPE_CHECKING
 
@@ -31,16 +35,16 @@ def _running_in_virtualenv() -> bool:
     )
 
 
-def _ensure_runtime_python() -> None:
-    runtime_root = Path(__file__).resolve().parent.parent / ".venv-runtime"
-    runtime_python = runtime_root / "bin" / "python"
+_IN_VENV = _running_in_virtualenv()
 
-    if _running_in_virtualenv():
-        return
 
-    if os.environ.get("SPONDEX_RUNTIME_ACTIVE") == "1":
+def _ensure_runtime_python() -> None:
+    if _IN_VENV or os.environ.get("SPONDEX_RUNTIME_ACTIVE") == "1":
         return
 
+    runtime_root = Path(__file__).resolve().parent.parent / ".venv-runtime"
+    runtime_python = runtime_root / "bin" / "python"
+
     if runtime_python.exists():
         os.environ["SPONDEX_RUNTIME_ACTIVE"] = "1"
         os.execv(str(runtime_python), [str(runtime_python), __file__, *sys.argv[1:]])
@@ -64,6 +68,10 @@ def _ensure_pip(logger: logging.Logger) -> bool:
         return False
 
 
+# Modules already confirmed importable by _ensure_package.
+_checked: set[str] = set()
+
+
 def _ensure_package(
     module: str,
     *,
@@ -76,23 +84,29 @@ def _ensure_package(
     failures will be logged but won't terminate the script.
     """
 
+    if module in _checked:
+        return True
+
     logger = logging.getLogger("clear_yandex_favorites")
     pip_name = install_name or module
     package_ref = f"{module} (pip install {pip_name})" if install_name else module
 
+    # Probe without importing: the caller imports the module when it needs it.
     try:
-        importlib.import_module(module)
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError) as exc:  # pragma: no cover - extremely rare env issues
+        logger.debug("Unexpected lookup error for '%s': %s", package_ref, exc)
+        spec = None
+    if spec is not None:
+        _checked.add(module)
         return True
-    except ModuleNotFoundError:
-        logger.warning(
-            "Package '%s' not found. Attempting to install...",
-            package_ref,
-        )
-    except Exception as exc:  # pragma: no cover - extremely rare env issues
-        logger.debug("Unexpected import error for '%s': %s", package_ref, exc)
-        logger.warning("Attempting to (re)install '%s'...", package_ref)
 
-    if not _running_in_virtualenv():
+    logger.warning(
+        "Package '%s' not found. Attempting to install...",
+        package_ref,
+    )
+
+    if not _IN_VENV:
         if not required:
             logger.info(
                 "Skipping auto-install of optional package '%s' outside of a virtual environment.",
@@ -127,7 +141,9 @@ def _ensure_package(
         return False
 
     try:
+        importlib.invalidate_caches()
         importlib.import_module(module)
+        _checked.add(module)
         return True
     except ModuleNotFoundError as exc:  # pragma: no cover - indicates broken install
         message = (
@@ -173,24 +189,31 @@ def _load_dotenv(path: str | os.PathLike[str] | None = None) -> None:
         )
         return
 
-    for raw_line in candidate.read_text(encoding="utf-8").splitlines():
+    _apply_dotenv_lines(candidate.read_text(encoding="utf-8"))
+
+
+def _apply_dotenv_lines(text: str) -> None:
+    """Minimal KEY=value parser; existing variables and earlier duplicates win."""
+    for raw_line in text.splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
+        if not line or line.startswith("#") or "=" not in line:
             continue
         key, value = line.split("=", 1)
         key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key and key not in os.environ:
-            os.environ[key] = value
-
+        if key:
+            os.environ.setdefault(key, value.strip().strip('"').strip("'"))
 
 
 load_dotenv = _load_dotenv
 
 logger = logging.getLogger("clear_yandex_favorites")
 
+DEFAULT_CHUNK_SIZE = 500
+# Larger batches get rejected by the likes endpoint.
+MAX_CHUNK_SIZE = 1000
+REMOVE_MAX_ATTEMPTS = 3
+REMOVE_RETRY_DELAY = 1.0
+
 
 def _get_yandex_client(token: str) -> "YandexClient":
     _ensure_package("yandex_music", install_name="yandex-music")
@@ -221,8 +244,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--chunk-size",
         type=int,
-        default=100,
-        help="Number of track IDs to send per delete request (default: 100).",
+        default=DEFAULT_CHUNK_SIZE,
+        help=(
+            f"Number of track IDs to send per delete request "
+            f"(default: {DEFAULT_CHUNK_SIZE}, max: {MAX_CHUNK_SIZE})."
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=6,
+        help="Number of delete requests to run in parallel (default: 6).",
     )
     parser.add_argument(
         "--verbose",
@@ -232,9 +264,60 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def chunked(sequence: List[str], size: int) -> Iterable[List[str]]:
-    for start in range(0, len(sequence), size):
-        yield sequence[start : start + size]
+def chunked(sequence: Iterable[str], size: int) -> Iterable[List[str]]:
+    iterator = iter(sequence)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _fetch_liked_track_ids(client: "YandexClient") -> List[str]:
+    """Return ``id:album_id`` strings straight from the likes payload.
+
+    ``users_likes_tracks`` wraps every entry in a ``TrackShort`` object; only
+    the identifiers are needed here, so the decoded JSON is read directly.
+    """
+
+    uid = client.me.account.uid
+    result = client._request.get(f"{client.base_url}/users/{uid}/likes/tracks")
+    entries = (result.get("library") or {}).get("tracks") or []
+    return [
+        f"{entry['id']}:{entry['album_id']}" if entry.get("album_id") else str(entry["id"])
+        for entry in entries
+    ]
+
+
+def _remove_batch(client: "YandexClient", batch: List[str]) -> int:
+    from yandex_music.exceptions import (  # type: ignore
+        BadRequestError,
+        NetworkError,
+        NotFoundError,
+    )
+
+    for attempt in range(1, REMOVE_MAX_ATTEMPTS + 1):
+        try:
+            client.users_likes_tracks_remove(batch)
+            return len(batch)
+        except BadRequestError:
+            logger.warning(
+                "Yandex rejected a batch of %d tracks; try a smaller --chunk-size.",
+                len(batch),
+            )
+            raise
+        except NotFoundError:
+            raise
+        except NetworkError as exc:
+            if attempt == REMOVE_MAX_ATTEMPTS:
+                raise
+            delay = REMOVE_RETRY_DELAY * 2 ** (attempt - 1)
+            logger.warning(
+                "Batch removal failed (%s); retrying in %.1f s (attempt %d/%d)...",
+                exc,
+                delay,
+                attempt + 1,
+                REMOVE_MAX_ATTEMPTS,
+            )
+            time.sleep(delay)
+    return 0  # pragma: no cover - loop always returns or raises
 
 
 def main() -> None:
@@ -243,7 +326,8 @@ def main() -> None:
     args = parse_args()
     configure_logging(args.verbose)
 
-    load_dotenv()
+    if not os.getenv("YANDEX_TOKEN"):
+        load_dotenv()
     token = os.getenv("YANDEX_TOKEN")
     if not token:
         logger.error("Environment variable YANDEX_TOKEN is missing. Aborting.")
@@ -253,8 +337,7 @@ def main() -> None:
     client = _get_yandex_client(token)
 
     logger.info("Fetching liked tracks list...")
-    liked_tracks = client.users_likes_tracks()
-    track_ids = [track.track_id for track in liked_tracks]
+    track_ids = _fetch_liked_track_ids(client)
     total = len(track_ids)
     logger.info("Found %d liked tracks.", total)
 
@@ -272,18 +355,35 @@ def main() -> None:
         )
         raise SystemExit(1)
 
+    chunk_size = max(1, min(args.chunk_size, MAX_CHUNK_SIZE))
+    if chunk_size != args.chunk_size:
+        logger.warning("Chunk size %d is out of range; using %d.", args.chunk_size, chunk_size)
+
     logger.warning(
         "Deleting ALL liked tracks from Yandex Music in batches of %d...",
-        args.chunk_size,
+        chunk_size,
     )
 
     removed = 0
-    for batch in chunked(track_ids, args.chunk_size):
-        client.users_likes_tracks_remove(batch)
-        removed += len(batch)
-        logger.debug("Removed %d tracks so far...", removed)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        futures = {
+            executor.submit(_remove_batch, client, batch): batch
+            for batch in chunked(track_ids, chunk_size)
+        }
+        for future in as_completed(futures):
+            try:
+                removed += future.result()
+            except Exception as exc:  # pragma: no cover - network path
+                failed += len(futures[future])
+                logger.error("Failed to remove a batch of %d tracks: %s", len(futures[future]), exc)
+                continue
+            logger.debug("Removed %d tracks so far...", removed)
 
     logger.info("Removal complete. %d tracks deleted from favorites.", removed)
+    if failed:
+        logger.error("%d tracks could not be removed; re-run the script to retry.", failed)
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -13,28 +13,28 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for <3.11
 
 
 def load_pyproject(pyproject_path: pathlib.Path) -> dict:
-    if not pyproject_path.exists():
-        raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path}")
-    return tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    try:
+        with pyproject_path.open("rb") as fh:
+            return tomllib.load(fh)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path}") from None
 
 
 def merge_dependencies(primary: Iterable[str], extras: Iterable[str]) -> List[str]:
-    seen = set()
-    ordered: List[str] = []
-    for source in (primary, extras):
-        for item in source:
-            normalized = item.strip()
-            if not normalized or normalized.startswith("#"):
-                continue
-            if normalized not in seen:
-                seen.add(normalized)
-                ordered.append(normalized)
-    return ordered
+    # dict keeps insertion order, so the first occurrence of each requirement wins.
+    return list(
+        dict.fromkeys(
+            normalized
+            for source in (primary, extras)
+            for item in source
+            if (normalized := item.strip()) and not normalized.startswith("#")
+        )
+    )
 
 
 def write_requirements(dependencies: Iterable[str], output: pathlib.Path) -> None:
     header = "# This file is auto-generated from pyproject.toml. Do not edit manually.\n"
-    output.write_text(header + "\n".join(dependencies) + "\n", encoding="utf-8")
+    output.write_bytes((header + "\n".join(dependencies) + "\n").encode("utf-8"))
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -11,19 +11,22 @@ from dotenv import load_dotenv
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
+CREDENTIAL_VARS = ("SPOTIPY_CLIENT_ID", "SPOTIPY_CLIENT_SECRET", "SPOTIPY_REDIRECT_URI")
+
+
 def main():
-    # Загружаем переменные окружения
-    try:
-        load_dotenv()
-    except Exception as e:
-        print(f"Ошибка при загрузке переменных окружения: {e}")
-        sys.exit(1)
-    
-    client_id = os.getenv("SPOTIPY_CLIENT_ID")
-    client_secret = os.getenv("SPOTIPY_CLIENT_SECRET")
-    redirect_uri = os.getenv("SPOTIPY_REDIRECT_URI")
+    # Загружаем переменные окружения (.env читаем, только если чего-то не хватает)
+    if not all(os.environ.get(name) for name in CREDENTIAL_VARS):
+        try:
+            load_dotenv()
+        except Exception as e:
+            print(f"Ошибка при загрузке переменных окружения: {e}")
+            sys.exit(1)
+
+    env = dict(os.environ)
+    client_id, client_secret, redirect_uri = (env.get(name) for name in CREDENTIAL_VARS)
     
-    if not all([client_id, client_secret, redirect_uri]):
+    if not (client_id and client_secret and redirect_uri):
         print("Ошибка: Не найдены необходимые переменные окружения.")
         print("Убедитесь, что файл .env содержит SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET и SPOTIPY_REDIRECT_URI")
         sys.exit(1)
@@ -80,7 +83,7 @@ def main():
             
             # Копируем кэш в текущий каталог
             try:
-                shutil.copy2(spotipy_cache_path, "./.cache")
+                shutil.copyfile(spotipy_cache_path, "./.cache")
                 print("Кэш-файл успешно скопирован в ./.cache")
                 print("Теперь вы можете запускать приложение в Docker!")
             except Exception as e:
@@ -103,11 +106,14 @@ def main():
                 ]
                 
                 for loc in possible_locations:
-                    if os.path.exists(loc):
-                        print(f"Найден кэш в: {loc}")
-                        shutil.copy2(loc, "./.cache")
-                        print("Скопирован в ./.cache")
-                        break
+                    try:
+                        os.stat(loc)
+                    except OSError:
+                        continue
+                    print(f"Найден кэш в: {loc}")
+                    shutil.copyfile(loc, "./.cache")
+                    print("Скопирован в ./.cache")
+                    break
                 else:
                     # Создаем новый кэш-файл на основе полученного токена
                     with open("./.cache", "w") as f:
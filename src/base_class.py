@@ -1,23 +1,28 @@
-from typing import Iterable, List, Optional
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence
 
 from .models import FavoriteAlbum, FavoriteArtist, PlaylistSnapshot
 
 
-class MusicService:
+class MusicService(ABC):
     def __init__(self) -> None:
         pass
 
+    @abstractmethod
     def get_tracks(self, force_full_sync: bool) -> List[dict]:
-        raise NotImplementedError("Subclasses must implement this method")
+        """Return the tracks from the user's library."""
 
+    @abstractmethod
     def search_track(self, artist: str, title: str) -> Optional[dict]:
-        raise NotImplementedError("Subclasses must implement this method")
+        """Find a track by artist and title, or return None."""
 
+    @abstractmethod
     def add_track(self, track: dict) -> Optional[str]:
-        raise NotImplementedError("Subclasses must implement this method")
+        """Add a track from the other service; return the new id if it was added."""
 
+    @abstractmethod
     def remove_duplicates(self):
-        raise NotImplementedError("Subclasses must implement this method")
+        """Remove duplicate tracks from the user's library."""
 
     # --- Optional advanced features -------------------------------------
 
@@ -32,11 +37,27 @@ class MusicService:
     def get_favorite_albums(self) -> List[FavoriteAlbum]:
         return []
 
+    @abstractmethod
+    def resolve_album(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
+        """Find the matching album in this service without changing the library."""
+
+    @abstractmethod
+    def add_albums(self, albums: Sequence[FavoriteAlbum]) -> List[FavoriteAlbum]:
+        """Add already resolved albums to the library in batches."""
+
     def ensure_album_in_library(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
         raise NotImplementedError("Subclasses must implement this method")
 
     def get_favorite_artists(self) -> List[FavoriteArtist]:
         return []
 
+    @abstractmethod
+    def resolve_artist(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
+        """Find the matching artist in this service without following it."""
+
+    @abstractmethod
+    def follow_artists(self, artists: Sequence[FavoriteArtist]) -> List[FavoriteArtist]:
+        """Follow already resolved artists in batches."""
+
     def ensure_artist_followed(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
-        raise NotImplementedError("Subclasses must implement this method")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement this method")
@@ -1,24 +1,48 @@
 import argparse
+import ast
 import datetime
+import functools
 import json
 import logging
 import os
 import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import psutil
+import requests
 import spotipy
 from dotenv import load_dotenv
 from flask import Flask, jsonify
+from requests.adapters import HTTPAdapter
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
 from yandex_music import Client as YandexClient
-from yandex_music.exceptions import YandexMusicError
+from yandex_music.exceptions import (
+    BadRequestError,
+    NetworkError,
+    NotFoundError,
+    TimedOutError,
+    UnauthorizedError,
+    YandexMusicError,
+)
+from yandex_music.utils import request as yandex_request
+from yandex_music.utils.difference import Difference
 
 from .base_class import MusicService
 from .models import FavoriteAlbum, FavoriteArtist, PlaylistSnapshot, PlaylistTrack
-from .sync_helpers import album_key, artist_key, match_entities, normalize_text
+from .sync_helpers import (
+    album_key,
+    album_similarity,
+    artist_key,
+    artist_similarity,
+    match_entities,
+    normalize_text,
+)
 
 from spotipy.exceptions import SpotifyException
 
@@ -109,6 +133,8 @@ def _load_deploy_version() -> Dict[str, Optional[str]]:
     return metadata
 
 
+# Одни и те же отметки времени встречаются во многих плейлистах; разбор кэшируем.
+@functools.lru_cache(maxsize=65536)
 def _parse_datetime(value: Optional[str]) -> Optional[datetime.datetime]:
     if not value:
         return None
@@ -142,6 +168,55 @@ def _join_artist_names(artists: Optional[Iterable[Any]]) -> Optional[str]:
     return ", ".join(sorted(filtered))
 
 
+def _join_spotify_artist_names(artists: Optional[Iterable[dict]]) -> Optional[str]:
+    """Имена исполнителей из ответа Spotify Web API в исходном порядке."""
+    return ", ".join(filter(None, (artist.get("name") for artist in artists or ()))) or None
+
+
+# Маркер отсутствующего значения в кэшах, где None — допустимый результат.
+_MISSING = object()
+
+# Ошибки, которые не исправятся повтором запроса: сразу пробрасываем их наверх.
+_NON_RETRYABLE = (BadRequestError, NotFoundError, UnauthorizedError)
+_NON_RETRYABLE_HTTP_STATUSES = frozenset({400, 401, 403, 404})
+
+
+def _retry_after_seconds(exc: SpotifyException) -> Optional[float]:
+    headers = getattr(exc, "headers", None) or {}
+    raw = headers.get("Retry-After") or headers.get("retry-after")
+    if raw is None:
+        return None
+    try:
+        return max(float(raw), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class _TokenBucket:
+    """Потокобезопасный token bucket: не больше ``rate`` запросов в секунду в среднем."""
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
 def check_and_fix_spotify_cache():
     """Проверяет и исправляет кэш файл Spotify если он некорректный"""
     cache_root = Path("./.cache")
@@ -164,13 +239,10 @@ def check_and_fix_spotify_cache():
     except json.JSONDecodeError:
         logger.warning("Обнаружен некорректный кэш файл Spotify, попытка исправления...")
         try:
-            # Пытаемся исправить, если это Python dict строка
-            if content.startswith("{'") and content.endswith("'}"):
-                # Преобразуем Python dict строку в валидный JSON
-                content_fixed = content.replace("'", '"')
-                # Проверяем, что теперь это валидный JSON
-                parsed = json.loads(content_fixed)
-
+            # Пытаемся исправить, если это repr() питоновского dict. literal_eval
+            # разбирает кавычки и экранирование корректно, в отличие от замены ' на ".
+            parsed = ast.literal_eval(content) if content.startswith("{") else None
+            if isinstance(parsed, dict):
                 # Перезаписываем файл с корректным JSON
                 cache_file.write_text(json.dumps(parsed))
                 logger.info("Кэш файл Spotify успешно исправлен")
@@ -188,6 +260,62 @@ def check_and_fix_spotify_cache():
         logger.error(f"Ошибка при проверке кэш файла: {e}")
 
 
+class _MemoizedCacheFileHandler(CacheFileHandler):
+    """Файловый кэш токена Spotify, который читает файл только один раз.
+
+    SpotifyOAuth запрашивает кэш перед каждым вызовом API; токен держим в памяти,
+    а при обновлении сразу записываем и в файл, чтобы он пережил перезапуск.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._token_info: Optional[dict] = None
+
+    def get_cached_token(self):
+        if self._token_info is None:
+            self._token_info = super().get_cached_token()
+        return self._token_info
+
+    def save_token_to_cache(self, token_info):
+        self._token_info = token_info
+        super().save_token_to_cache(token_info)
+
+
+# Сколько результатов поиска держим в памяти на один сервис.
+_SEARCH_CACHE_SIZE = 10_000
+
+
+# Защищает OrderedDict кэша поиска: add_track вызывается из пулов потоков.
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def _memoize_search(func: Callable[[Any, str, str], Optional[dict]]):
+    """LRU-кэш для search_track по паре (исполнитель, название) без учёта регистра.
+
+    Ключ не проходит через normalize_text: запросы, отличающиеся только
+    пунктуацией, могут вернуть разные треки. Кэшируются только найденные треки,
+    чтобы временная ошибка или пустой ответ не закрепились до конца запуска.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, artist: str, title: str) -> Optional[dict]:
+        key = ((artist or "").casefold().strip(), (title or "").casefold().strip())
+        cache = self._search_cache
+        with _SEARCH_CACHE_LOCK:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        result = func(self, artist, title)
+        if result:
+            with _SEARCH_CACHE_LOCK:
+                cache[key] = result
+                if len(cache) > _SEARCH_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
 # Flask application for status endpoint
 app = Flask(__name__)
 app._start_time = time.time()
@@ -261,12 +389,94 @@ def status():
         }), 500
 
 
+# Размер пула keep-alive соединений для HTTP-клиентов Spotify и Яндекса.
+_HTTP_POOL_SIZE = 20
+
+
+def _mount_pooled_adapter(session: requests.Session, pool_size: int = _HTTP_POOL_SIZE) -> None:
+    """Расширяет пул соединений сессии, сохраняя настройки повторов адаптера."""
+    current = session.get_adapter("https://")
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=getattr(current, "max_retries", 0),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+class _PooledYandexRequest(yandex_request.Request):
+    """Request из yandex-music, работающий через общую keep-alive сессию.
+
+    Библиотека вызывает модульный ``requests.request``, то есть открывает новое
+    TCP/TLS-соединение на каждый запрос, и своей сессии у неё нет. Логика
+    обработки ответов повторяет ``Request._request_wrapper`` из yandex-music
+    2.2.0; расхождение с библиотекой ловит тест в tests/test_helpers.py.
+    """
+
+    def __init__(self, *args: Any, pool_size: int = _HTTP_POOL_SIZE, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._session = requests.Session()
+        _mount_pooled_adapter(self._session, pool_size)
+
+    def _request_wrapper(self, *args: Any, **kwargs: Any) -> bytes:
+        kwargs.setdefault("headers", {})["User-Agent"] = yandex_request.USER_AGENT
+        if kwargs["timeout"] is yandex_request.default_timeout:
+            kwargs["timeout"] = self._timeout
+
+        try:
+            resp = self._session.request(*args, **kwargs)
+        except requests.Timeout as exc:
+            raise TimedOutError from exc
+        except requests.RequestException as exc:
+            raise NetworkError(exc) from exc
+
+        if 200 <= resp.status_code <= 299:
+            return resp.content
+
+        try:
+            message = self._parse(resp.content).get_error()
+        except YandexMusicError:
+            message = "Unknown HTTPError"
+
+        if resp.status_code in (401, 403):
+            raise UnauthorizedError(message)
+        if resp.status_code == 400:
+            raise BadRequestError(message)
+        if resp.status_code == 404:
+            raise NotFoundError(message)
+        if resp.status_code in (409, 413):
+            raise NetworkError(message)
+        if resp.status_code == 502:
+            raise NetworkError("Bad Gateway")
+        raise NetworkError(f"{message} ({resp.status_code}): {resp.content}")
+
+
+# Сколько альбомов/исполнителей добавляем в библиотеку одним запросом.
+_LIBRARY_WRITE_BATCH_SIZE = 50
+# Save Albums в Spotify принимает не больше 20 ID за вызов.
+_SPOTIFY_ALBUM_WRITE_BATCH_SIZE = 20
+# Сколько треков запрашиваем одним вызовом client.tracks().
+_YANDEX_TRACKS_BATCH_SIZE = 50
+# Сколько плейлистов Яндекса загружаем одновременно.
+_YANDEX_PLAYLIST_WORKERS = 6
+
+
 class YandexMusic(MusicService):
     def __init__(self, token: str):
         super().__init__()
-        self.client = YandexClient(token=token).init()
+        self._search_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        # track_id -> album_id (None, если у трека нет альбома).
+        self._album_id_cache: Dict[str, Optional[str]] = {}
+        # Нормализованное название плейлиста -> kind.
+        self._playlist_index: Optional[Dict[str, str]] = None
+        # track_id -> Future запроса альбома, который уже выполняется.
+        self._album_inflight: Dict[str, Future] = {}
+        self._album_inflight_lock = threading.Lock()
+        self.client = YandexClient(token=token, request=_PooledYandexRequest()).init()
         self._max_attempts = 5
         self._base_retry_delay = 1.5
+        self._max_retry_delay = 8.0
 
     @staticmethod
     def _get_attr(source: Any, key: str) -> Any:
@@ -339,9 +549,14 @@ class YandexMusic(MusicService):
         for attempt in range(1, self._max_attempts + 1):
             try:
                 return func()
+            except _NON_RETRYABLE:
+                raise
             except YandexMusicError as exc:
                 last_attempt = attempt == self._max_attempts
-                wait_time = self._base_retry_delay * (2 ** (attempt - 1))
+                wait_time = min(
+                    self._base_retry_delay * (2 ** (attempt - 1)),
+                    self._max_retry_delay,
+                )
                 jitter = random.uniform(0, 0.5)
                 total_wait = wait_time + jitter
                 if last_attempt:
@@ -364,17 +579,21 @@ class YandexMusic(MusicService):
             except Exception:
                 if attempt == self._max_attempts:
                     raise
-                time.sleep(self._base_retry_delay * (2 ** (attempt - 1)))
+                time.sleep(
+                    min(self._base_retry_delay * (2 ** (attempt - 1)), self._max_retry_delay)
+                )
 
     def get_tracks(self, force_full_sync: bool) -> List[dict]:
-        short_tracks = self.client.users_likes_tracks()
-        full_tracks = []
-
-        for track in short_tracks:
-            full_tracks.append(track.fetch_track())
-
-        return full_tracks
-
+        short_tracks = self.client.users_likes_tracks() or []
+        track_ids = [str(track.track_id) for track in short_tracks]
+        full_tracks = self._fetch_full_tracks(track_ids)
+        return [
+            full_tracks[bare_id]
+            for bare_id in (tid.split(":", 1)[0] for tid in track_ids)
+            if bare_id in full_tracks
+        ]
+
+    @_memoize_search
     def search_track(self, artist: str, title: str) -> Optional[dict]:
         query = f"{artist} {title}"
         result = self.client.search(query)
@@ -400,7 +619,11 @@ class YandexMusic(MusicService):
         return fallback_candidate
 
     def add_track(self, track: dict) -> Optional[str]:
-        artist_name = track["track"]["artists"][0]["name"]
+        artists = track["track"].get("artists") or []
+        if not artists:
+            logger.warning("Пропускаю трек Spotify без исполнителей: %s", track["track"].get("name"))
+            return None
+        artist_name = artists[0]["name"]
         title = track["track"]["name"]
 
         resolved = self.resolve_track_for_playlist(
@@ -421,15 +644,26 @@ class YandexMusic(MusicService):
 
     def remove_duplicates(self):
         tracks = self.client.users_likes_tracks()
-        tracks_seen = set()
-        tracks_to_remove = []
+        track_ids = [str(track.track_id) for track in tracks or []]
 
-        for track in tracks:
-            full_track = track.fetch_track()
-            key = (full_track.title.lower(), full_track.artists[0].name.lower())
+        keys: Dict[str, Tuple[str, str]] = {}
+        for track_id, full_track in self._fetch_full_tracks(track_ids).items():
+            artists = getattr(full_track, "artists", None)
+            if not full_track.title or not artists:
+                continue
+            keys[track_id] = (
+                full_track.title.casefold(),
+                (artists[0].name or "").casefold(),
+            )
 
+        tracks_seen = set()
+        tracks_to_remove = []
+        for track_id in track_ids:
+            key = keys.get(track_id.split(":", 1)[0])
+            if key is None:
+                continue
             if key in tracks_seen:
-                tracks_to_remove.append(track.track_id)
+                tracks_to_remove.append(track_id)
             else:
                 tracks_seen.add(key)
 
@@ -437,23 +671,69 @@ class YandexMusic(MusicService):
             self.client.users_likes_tracks_remove(tracks_to_remove)
             logger.info(f"Removed {len(tracks_to_remove)} duplicate tracks from Yandex")
 
-    def _get_album_id_for_track(self, track_id: str) -> Optional[str]:
-        def _fetch():
-            return self.client.tracks(track_id)
+    def _fetch_full_tracks(self, track_ids: Sequence[str]) -> Dict[str, Any]:
+        """Полные объекты треков по id (в т.ч. вида ``track:album``), пачками вместо fetch_track()."""
+        bare_ids = list(dict.fromkeys(str(tid).split(":", 1)[0] for tid in track_ids))
+        cache = self._album_id_cache
+        result: Dict[str, Any] = {}
+        for start in range(0, len(bare_ids), _YANDEX_TRACKS_BATCH_SIZE):
+            chunk = bare_ids[start : start + _YANDEX_TRACKS_BATCH_SIZE]
+            full_tracks = self._execute_with_retry(
+                f"Fetch Yandex track metadata for {len(chunk)} tracks",
+                functools.partial(self.client.tracks, chunk),
+            ) or []
+            for full_track in full_tracks:
+                track_id = getattr(full_track, "id", None)
+                if track_id is None:
+                    continue
+                cache.setdefault(str(track_id), self._first_album_id(full_track))
+                result[str(track_id)] = full_track
+        return result
 
-        tracks = self._execute_with_retry(
-            f"Fetch Yandex track metadata {track_id}", _fetch
-        )
-        if not tracks:
-            return None
-        track_obj = tracks[0]
+    @staticmethod
+    def _first_album_id(track_obj: Any) -> Optional[str]:
         albums = getattr(track_obj, "albums", None)
         if not albums:
             return None
-        album = albums[0]
-        album_id = getattr(album, "id", None)
+        album_id = getattr(albums[0], "id", None)
         return str(album_id) if album_id is not None else None
 
+    def _prefetch_album_ids(self, track_ids: Iterable[str]) -> None:
+        cache = self._album_id_cache
+        missing = list(dict.fromkeys(str(tid) for tid in track_ids if str(tid) not in cache))
+        # Найденные треки _fetch_full_tracks уже записал в кэш; остальные
+        # запоминаем как треки без альбома, чтобы не запрашивать их снова.
+        fetched = self._fetch_full_tracks(missing)
+        for track_id in missing:
+            if track_id not in fetched:
+                cache.setdefault(track_id, None)
+
+    def _get_album_id_for_track(self, track_id: str) -> Optional[str]:
+        track_id = str(track_id)
+        cache = self._album_id_cache
+        if track_id in cache:
+            return cache[track_id]
+
+        # Параллельные запросы одного и того же трека ждут первый, а не дублируют его.
+        with self._album_inflight_lock:
+            pending = self._album_inflight.get(track_id)
+            owner = pending is None
+            if owner:
+                pending = self._album_inflight[track_id] = Future()
+        if not owner:
+            return pending.result()
+
+        try:
+            self._prefetch_album_ids([track_id])
+            pending.set_result(cache.get(track_id))
+        except BaseException as exc:
+            pending.set_exception(exc)
+            raise
+        finally:
+            with self._album_inflight_lock:
+                self._album_inflight.pop(track_id, None)
+        return pending.result()
+
     def resolve_track_for_playlist(
         self,
         spotify_track_id: Optional[str],
@@ -473,13 +753,7 @@ class YandexMusic(MusicService):
         if not search_result:
             return None
 
-        def _get_value(obj: Any, key: str) -> Any:
-            if obj is None:
-                return None
-            if isinstance(obj, dict):
-                return obj.get(key)
-            return getattr(obj, key, None)
-
+        _get_value = self._get_attr
         track_identifier = _get_value(search_result, "id")
         if track_identifier is None:
             track_identifier = _get_value(search_result, "track_id")
@@ -546,14 +820,16 @@ class YandexMusic(MusicService):
 
         normalized_target = normalize_text(name)
 
-        def _list():
-            return self.client.users_playlists_list()
+        if self._playlist_index is None:
+            def _list():
+                return self.client.users_playlists_list()
 
-        playlists = self._execute_with_retry("List Yandex playlists", _list)
-        for playlist in playlists or []:
-            title = getattr(playlist, "title", "")
-            if normalize_text(title) == normalized_target:
-                return self.fetch_playlist(str(getattr(playlist, "kind", "")))
+            playlists = self._execute_with_retry("List Yandex playlists", _list)
+            self._index_playlists(playlists or [])
+
+        existing_kind = self._playlist_index.get(normalized_target)
+        if existing_kind is not None:
+            return self.fetch_playlist(existing_kind)
 
         def _create():
             return self.client.users_playlists_create(name, visibility="private")
@@ -561,8 +837,17 @@ class YandexMusic(MusicService):
         created = self._execute_with_retry(
             f"Create Yandex playlist '{name}'", _create
         )
+        if created is not None and getattr(created, "kind", None) is not None:
+            self._playlist_index.setdefault(normalized_target, str(created.kind))
         return created
 
+    def _index_playlists(self, playlists: Iterable[Any]) -> None:
+        index: Dict[str, str] = {}
+        for playlist in playlists:
+            title = getattr(playlist, "title", "")
+            index.setdefault(normalize_text(title), str(getattr(playlist, "kind", "")))
+        self._playlist_index = index
+
     def insert_track_into_playlist(
         self,
         playlist_obj,
@@ -573,24 +858,25 @@ class YandexMusic(MusicService):
         current_playlist = playlist_obj
 
         for attempt in range(2):
-            tracks_attr = getattr(current_playlist, "tracks", []) or []
-            if at is not None:
-                position = min(len(tracks_attr), at)
-            else:
-                position = len(tracks_attr)
+            # Атрибуты плейлиста читаем один раз на попытку.
+            kind = getattr(current_playlist, "kind", None)
+            revision = getattr(current_playlist, "revision", 1)
+            track_count = len(getattr(current_playlist, "tracks", None) or [])
+            label = getattr(current_playlist, "title", None) or kind or "unknown"
+            position = track_count if at is None else min(track_count, at)
 
             def _insert():
                 return self.client.users_playlists_insert_track(
-                    getattr(current_playlist, "kind"),
+                    kind,
                     track_id,
                     album_id,
                     at=position,
-                    revision=getattr(current_playlist, "revision", 1),
+                    revision=revision,
                 )
 
             try:
                 updated = self._execute_with_retry(
-                    f"Insert track {track_id}:{album_id} into Yandex playlist {getattr(current_playlist, 'kind', 'unknown')}",
+                    f"Insert track {track_id}:{album_id} into Yandex playlist {kind if kind is not None else 'unknown'}",
                     _insert,
                 )
                 return updated or current_playlist
@@ -598,13 +884,13 @@ class YandexMusic(MusicService):
                 if attempt == 0 and self._is_playlist_full_error(exc):
                     logger.warning(
                         "Плейлист %s заполнен, освобождаю место для новых треков",
-                        getattr(current_playlist, "title", getattr(current_playlist, "kind", "unknown")),
+                        label,
                     )
                     trimmed = self._make_space_in_playlist(current_playlist)
                     if not trimmed:
                         logger.error(
                             "Не удалось освободить место в плейлисте %s: %s",
-                            getattr(current_playlist, "title", getattr(current_playlist, "kind", "unknown")),
+                            label,
                             exc,
                         )
                         raise
@@ -613,16 +899,16 @@ class YandexMusic(MusicService):
                 elif attempt == 0 and self._is_wrong_revision_error(exc):
                     logger.warning(
                         "Revision плейлиста %s устарел, обновляю данные плейлиста",
-                        getattr(current_playlist, "title", getattr(current_playlist, "kind", "unknown")),
+                        label,
                     )
-                    refreshed_playlist = self.fetch_playlist(str(getattr(current_playlist, "kind", "")))
+                    refreshed_playlist = self.fetch_playlist(str(kind if kind is not None else ""))
                     if refreshed_playlist:
                         current_playlist = refreshed_playlist
                         continue
                     else:
                         logger.error(
                             "Не удалось обновить плейлист %s: %s",
-                            getattr(current_playlist, "title", getattr(current_playlist, "kind", "unknown")),
+                            label,
                             exc,
                         )
                         raise
@@ -630,6 +916,67 @@ class YandexMusic(MusicService):
 
         return current_playlist
 
+    def insert_tracks_into_playlist(
+        self,
+        playlist_obj,
+        tracks: Sequence[Tuple[str, str]],
+    ) -> Tuple[Any, int]:
+        """Добавляет пары (track_id, album_id) в конец плейлиста.
+
+        Сначала пробует одну операцию insert со всеми треками; если Яндекс её
+        отклонил, добавляет треки по одному (с обработкой переполнения и
+        устаревшей ревизии). Возвращает актуальный плейлист и число добавленных треков.
+        """
+        current_playlist = playlist_obj
+        start = len(getattr(playlist_obj, "tracks", []) or [])
+        if not tracks:
+            return current_playlist, 0
+
+        kind = getattr(playlist_obj, "kind", None)
+        diff = Difference().add_insert(
+            start, [{"id": track_id, "album_id": album_id} for track_id, album_id in tracks]
+        )
+        try:
+            updated = self._execute_with_retry(
+                f"Insert {len(tracks)} tracks into Yandex playlist {kind}",
+                functools.partial(
+                    self.client.users_playlists_change,
+                    kind,
+                    diff.to_json(),
+                    getattr(playlist_obj, "revision", 1),
+                ),
+            )
+            return updated or current_playlist, len(tracks)
+        except YandexMusicError as exc:
+            logger.warning(
+                "Пакетная вставка в плейлист %s не удалась (%s), добавляю треки по одному",
+                getattr(playlist_obj, "title", None) or kind,
+                exc,
+            )
+
+        added = 0
+        for track_id, album_id in tracks:
+            try:
+                updated = self.insert_track_into_playlist(
+                    current_playlist,
+                    track_id,
+                    album_id,
+                    at=start + added,
+                )
+            except Exception as exc:
+                logger.error(
+                    "Ошибка добавления трека %s:%s в плейлист %s: %s",
+                    track_id,
+                    album_id,
+                    getattr(current_playlist, "title", getattr(current_playlist, "kind", "unknown")),
+                    exc,
+                )
+                continue
+            if updated:
+                current_playlist = updated
+            added += 1
+        return current_playlist, added
+
     def _resolve_playlist_fetch_params(
         self, playlist_obj
     ) -> Tuple[Optional[str], Optional[str]]:
@@ -830,15 +1177,27 @@ class YandexMusic(MusicService):
             "Fetch Yandex playlists", self.client.users_playlists_list
         )
         snapshots: List[PlaylistSnapshot] = []
+        album_cache = self._album_id_cache
+        playlists = list(playlists or [])
+        self._index_playlists(playlists)
 
-        for playlist in playlists:
-            self._execute_with_retry(
+        def _fetch_tracks(playlist):
+            return self._execute_with_retry(
                 f"Fetch Yandex playlist tracks ({playlist.kind})",
                 playlist.fetch_tracks,
             )
-            full_playlist = playlist
+
+        # Треки плейлистов запрашиваем параллельно, снимки собираем уже в исходном порядке.
+        with ThreadPoolExecutor(
+            max_workers=_YANDEX_PLAYLIST_WORKERS,
+            thread_name_prefix="yandex-playlists",
+        ) as executor:
+            fetched_tracks = list(executor.map(_fetch_tracks, playlists))
+
+        # fetch_tracks возвращает треки, но не записывает их в playlist.tracks.
+        for full_playlist, playlist_tracks in zip(playlists, fetched_tracks):
             tracks: List[PlaylistTrack] = []
-            for position, playlist_track in enumerate(getattr(full_playlist, "tracks", []) or []):
+            for position, playlist_track in enumerate(playlist_tracks or []):
                 track_id = getattr(playlist_track, "track_id", None)
                 if not track_id:
                     continue
@@ -852,6 +1211,9 @@ class YandexMusic(MusicService):
                     albums = getattr(track_obj, "albums", [])
                     if albums:
                         album_id = str(getattr(albums[0], "id", ""))
+                    if getattr(track_obj, "id", None) is not None:
+                        # Метаданные уже загружены, запоминаем альбом без лишних запросов.
+                        album_cache[str(track_obj.id)] = album_id or None
                 added_at = _parse_datetime(getattr(playlist_track, "timestamp", None))
                 tracks.append(
                     PlaylistTrack(
@@ -886,6 +1248,45 @@ class YandexMusic(MusicService):
 
         return snapshots
 
+    def library_fingerprint(
+        self, playlists: bool, albums: bool, artists: bool
+    ) -> Tuple[Any, ...]:
+        """Дешёвый слепок состояния библиотеки: меняется, когда меняются данные."""
+        likes = self._execute_with_retry(
+            "Fetch Yandex liked tracks revision", self.client.users_likes_tracks
+        )
+        parts: List[Any] = [
+            ("tracks", getattr(likes, "revision", None), len(getattr(likes, "tracks", None) or []))
+        ]
+        if playlists:
+            listing = self._execute_with_retry(
+                "Fetch Yandex playlists revisions", self.client.users_playlists_list
+            )
+            parts.append(
+                (
+                    "playlists",
+                    tuple(
+                        (getattr(item, "kind", None), getattr(item, "revision", None))
+                        for item in listing or []
+                    ),
+                )
+            )
+        if albums:
+            liked_albums = self._execute_with_retry(
+                "Fetch Yandex favorite albums", self.client.users_likes_albums
+            )
+            parts.append(
+                ("albums", tuple(getattr(like, "id", None) for like in liked_albums or []))
+            )
+        if artists:
+            liked_artists = self._execute_with_retry(
+                "Fetch Yandex favorite artists", self.client.users_likes_artists
+            )
+            parts.append(
+                ("artists", tuple(getattr(like, "id", None) for like in liked_artists or []))
+            )
+        return tuple(parts)
+
     def get_favorite_albums(self) -> List[FavoriteAlbum]:
         likes = self._execute_with_retry(
             "Fetch Yandex favorite albums", self.client.users_likes_albums
@@ -906,7 +1307,7 @@ class YandexMusic(MusicService):
             )
         return favorites
 
-    def ensure_album_in_library(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
+    def resolve_album(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
         query_parts = [album.name or "", album.artist or ""]
         query = " ".join(part for part in query_parts if part).strip()
         if not query:
@@ -915,7 +1316,7 @@ class YandexMusic(MusicService):
 
         search = self._execute_with_retry(
             f"Search Yandex album '{query}'",
-            lambda: self.client.search(query, type_="album"),
+            functools.partial(self.client.search, query, type_="album"),
         )
 
         candidates: List[Any] = []
@@ -950,27 +1351,11 @@ class YandexMusic(MusicService):
                 if fallback is None and candidate_album.name and candidate_album.artist:
                     fallback = candidate_album
                 continue
-
-            def _add_candidate():
-                return self.client.users_likes_albums_add([candidate_album.album_id])
-
-            self._execute_with_retry(
-                f"Add Yandex album {candidate_album.album_id}", _add_candidate
-            )
-            logger.info(
-                "Добавлен альбом в Yandex: %s — %s",
-                candidate_album.artist,
-                candidate_album.name,
-            )
             return candidate_album
 
         if fallback:
-            self._execute_with_retry(
-                f"Add Yandex album {fallback.album_id}",
-                lambda: self.client.users_likes_albums_add([fallback.album_id]),
-            )
             logger.info(
-                "Добавлен альбом в Yandex (fallback): %s — %s",
+                "Альбом в Yandex найден приблизительно (fallback): %s — %s",
                 fallback.artist,
                 fallback.name,
             )
@@ -981,6 +1366,25 @@ class YandexMusic(MusicService):
         )
         return None
 
+    def add_albums(self, albums: Sequence[FavoriteAlbum]) -> List[FavoriteAlbum]:
+        unique = list({album.album_id: album for album in albums}.values())
+        for start in range(0, len(unique), _LIBRARY_WRITE_BATCH_SIZE):
+            batch = unique[start : start + _LIBRARY_WRITE_BATCH_SIZE]
+            ids = [album.album_id for album in batch]
+            self._execute_with_retry(
+                f"Add {len(ids)} Yandex albums",
+                functools.partial(self.client.users_likes_albums_add, ids),
+            )
+            for album in batch:
+                logger.info("Добавлен альбом в Yandex: %s — %s", album.artist, album.name)
+        return unique
+
+    def ensure_album_in_library(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
+        resolved = self.resolve_album(album)
+        if resolved:
+            self.add_albums([resolved])
+        return resolved
+
     def get_favorite_artists(self) -> List[FavoriteArtist]:
         likes = self._execute_with_retry(
             "Fetch Yandex favorite artists", self.client.users_likes_artists
@@ -1000,7 +1404,7 @@ class YandexMusic(MusicService):
             )
         return favorites
 
-    def ensure_artist_followed(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
+    def resolve_artist(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
         query = artist.name
         if not query:
             logger.debug("Skipping Yandex artist ensure: missing name for %s", artist)
@@ -1008,7 +1412,7 @@ class YandexMusic(MusicService):
 
         search = self._execute_with_retry(
             f"Search Yandex artist '{query}'",
-            lambda: self.client.search(query, type_="artist"),
+            functools.partial(self.client.search, query, type_="artist"),
         )
         candidates: List[Any] = []
         direct_results: List[Any] = []
@@ -1041,28 +1445,11 @@ class YandexMusic(MusicService):
                 if fallback is None and candidate_artist.name:
                     fallback = candidate_artist
                 continue
-
-            def _follow_candidate():
-                return self.client.users_likes_artists_add(
-                    [candidate_artist.artist_id]
-                )
-
-            self._execute_with_retry(
-                f"Follow Yandex artist {candidate_artist.artist_id}",
-                _follow_candidate,
-            )
-            logger.info("Добавлен исполнитель в Yandex: %s", candidate_artist.name)
             return candidate_artist
 
         if fallback:
-            self._execute_with_retry(
-                f"Follow Yandex artist {fallback.artist_id}",
-                lambda: self.client.users_likes_artists_add([
-                    fallback.artist_id
-                ]),
-            )
             logger.info(
-                "Добавлен исполнитель в Yandex (fallback): %s",
+                "Исполнитель в Yandex найден приблизительно (fallback): %s",
                 fallback.name,
             )
             return fallback
@@ -1070,10 +1457,54 @@ class YandexMusic(MusicService):
         logger.warning("Не удалось найти исполнителя в Yandex по запросу '%s'", query)
         return None
 
+    def follow_artists(self, artists: Sequence[FavoriteArtist]) -> List[FavoriteArtist]:
+        unique = list({artist.artist_id: artist for artist in artists}.values())
+        for start in range(0, len(unique), _LIBRARY_WRITE_BATCH_SIZE):
+            batch = unique[start : start + _LIBRARY_WRITE_BATCH_SIZE]
+            ids = [artist.artist_id for artist in batch]
+            self._execute_with_retry(
+                f"Follow {len(ids)} Yandex artists",
+                functools.partial(self.client.users_likes_artists_add, ids),
+            )
+            for artist in batch:
+                logger.info("Добавлен исполнитель в Yandex: %s", artist.name)
+        return unique
+
+    def ensure_artist_followed(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
+        resolved = self.resolve_artist(artist)
+        if resolved:
+            self.follow_artists([resolved])
+        return resolved
+
+
+# Максимальный размер страницы playlist_items в Spotify Web API.
+_SPOTIFY_PLAYLIST_PAGE_SIZE = 100
+# Сколько страниц плейлистов Spotify запрашиваем одновременно.
+_SPOTIFY_PAGE_WORKERS = 8
+# Максимальный размер страницы current_user_saved_tracks.
+_SPOTIFY_SAVED_TRACKS_PAGE_SIZE = 50
+# Максимальный размер страницы current_user_saved_albums.
+_SPOTIFY_SAVED_ALBUMS_PAGE_SIZE = 50
+# Таймаут HTTP-запроса к Spotify и число повторов на уровне urllib3.
+_SPOTIFY_REQUEST_TIMEOUT = 10
+_SPOTIFY_HTTP_RETRIES = 5
+# Максимальный размер страницы поиска Spotify.
+_SPOTIFY_SEARCH_LIMIT = 50
+# Минимальная похожесть для нечёткого сопоставления альбомов и исполнителей.
+_FUZZY_MATCH_THRESHOLD = 0.9
+# Средняя частота запросов к Spotify, чтобы параллельные загрузки не упирались в 429.
+_SPOTIFY_REQUESTS_PER_SECOND = 20.0
+# Поля playlist_items, которые реально используются при сборке снимка.
+_SPOTIFY_PLAYLIST_ITEM_FIELDS = "items(added_at,track(id,name,artists(name))),next,total"
+
 
 class SpotifyMusic(MusicService):
     def __init__(self):
         super().__init__()
+        self._search_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        # (исполнитель, название) в нижнем регистре для всех треков из «Любимых».
+        self._saved_track_keys: Optional[set] = None
+        self._saved_index_lock = threading.Lock()
         required_scopes = " ".join(
             [
                 "user-library-read",
@@ -1085,10 +1516,30 @@ class SpotifyMusic(MusicService):
             ]
         )
         self.client = spotipy.Spotify(
-            auth_manager=SpotifyOAuth(scope=required_scopes)
+            auth_manager=SpotifyOAuth(
+                scope=required_scopes,
+                cache_handler=_MemoizedCacheFileHandler(),
+            ),
+            # 5xx повторяет urllib3 внутри spotipy. 429 сюда не входит: после
+            # исчерпания попыток urllib3 теряет заголовки ответа, а Retry-After
+            # учитывает только _execute_with_retry, через который идут все
+            # вызовы self.client.
+            requests_timeout=_SPOTIFY_REQUEST_TIMEOUT,
+            retries=_SPOTIFY_HTTP_RETRIES,
+            status_retries=_SPOTIFY_HTTP_RETRIES,
+            status_forcelist=(500, 502, 503, 504),
+            backoff_factor=0.3,
         )
-        self._max_attempts = 5
+        # spotipy держит одну сессию, но пул по умолчанию (10) меньше числа
+        # потоков, которые параллельно выкачивают страницы плейлистов.
+        _mount_pooled_adapter(self.client._session)
+        # Общий на все потоки ограничитель частоты запросов к Web API.
+        self._rate_limiter: Optional[_TokenBucket] = _TokenBucket(
+            rate=_SPOTIFY_REQUESTS_PER_SECOND, capacity=_SPOTIFY_REQUESTS_PER_SECOND
+        )
+        self._max_attempts = 3
         self._base_retry_delay = 1.0
+        self._max_retry_delay = 8.0
         user_profile = self._execute_with_retry(
             "Fetch Spotify current user",
             self.client.me,
@@ -1096,10 +1547,45 @@ class SpotifyMusic(MusicService):
         self._current_user_id = (user_profile or {}).get("id")
         self._user_country = (user_profile or {}).get("country")
     
+    def _fetch_playlist_items_page(self, playlist_id: str, offset: int) -> dict:
+        return self._execute_with_retry(
+            f"Fetch Spotify playlist {playlist_id} tracks offset={offset}",
+            functools.partial(
+                self.client.playlist_items,
+                playlist_id,
+                offset=offset,
+                fields=_SPOTIFY_PLAYLIST_ITEM_FIELDS,
+                limit=_SPOTIFY_PLAYLIST_PAGE_SIZE,
+                additional_types=("track",),
+            ),
+        ) or {}
+
+    def _iter_playlist_item_pages(
+        self,
+        playlist_id: str,
+        executor: Optional[Executor],
+    ) -> Iterable[dict]:
+        first_page = self._fetch_playlist_items_page(playlist_id, 0)
+        yield first_page
+        if not first_page.get("next"):
+            return
+
+        # Зная total, запрашиваем оставшиеся страницы параллельно; map сохраняет порядок.
+        offsets = range(
+            _SPOTIFY_PLAYLIST_PAGE_SIZE,
+            first_page.get("total") or 0,
+            _SPOTIFY_PLAYLIST_PAGE_SIZE,
+        )
+        def fetch(off: int) -> dict:
+            return self._fetch_playlist_items_page(playlist_id, off)
+
+        yield from (executor.map(fetch, offsets) if executor else map(fetch, offsets))
+
     def _build_playlist_snapshot(
         self,
         playlist_obj: dict,
         include_followed: bool,
+        executor: Optional[Executor] = None,
     ) -> Optional[PlaylistSnapshot]:
         playlist_id = playlist_obj.get("id")
         if not playlist_id:
@@ -1111,18 +1597,8 @@ class SpotifyMusic(MusicService):
             return None
 
         tracks: List[PlaylistTrack] = []
-        track_offset = 0
         position = 0
-        while True:
-            track_response = self._execute_with_retry(
-                f"Fetch Spotify playlist {playlist_id} tracks offset={track_offset}",
-                lambda off=track_offset: self.client.playlist_items(
-                    playlist_id,
-                    offset=off,
-                    limit=100,
-                    additional_types=("track",),
-                ),
-            )
+        for track_response in self._iter_playlist_item_pages(playlist_id, executor):
             track_items = track_response.get("items", [])
             if not track_items:
                 break
@@ -1133,11 +1609,7 @@ class SpotifyMusic(MusicService):
                 if not track_id:
                     continue
                 added_at = _parse_datetime(item.get("added_at"))
-                artist_name = ", ".join(
-                    artist.get("name")
-                    for artist in track_data.get("artists", [])
-                    if artist.get("name")
-                ) or None
+                artist_name = _join_spotify_artist_names(track_data.get("artists"))
                 tracks.append(
                     PlaylistTrack(
                         track_id=track_id,
@@ -1149,10 +1621,6 @@ class SpotifyMusic(MusicService):
                 )
                 position += 1
 
-            track_offset += len(track_items)
-            if not track_response.get("next"):
-                break
-
         return PlaylistSnapshot(
             service="spotify",
             playlist_id=playlist_id,
@@ -1166,13 +1634,21 @@ class SpotifyMusic(MusicService):
 
     def _execute_with_retry(self, description: str, func: Callable[[], Any]):
         for attempt in range(1, self._max_attempts + 1):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
             try:
                 return func()
             except SpotifyException as exc:
+                if exc.http_status in _NON_RETRYABLE_HTTP_STATUSES:
+                    raise
                 last_attempt = attempt == self._max_attempts
-                wait_time = self._base_retry_delay * (2 ** (attempt - 1))
+                wait_time = min(
+                    self._base_retry_delay * (2 ** (attempt - 1)),
+                    self._max_retry_delay,
+                )
                 jitter = random.uniform(0, 0.5)
-                total_wait = wait_time + jitter
+                retry_after = _retry_after_seconds(exc)
+                total_wait = retry_after if retry_after is not None else wait_time + jitter
                 if last_attempt:
                     logger.error(
                         "%s failed after %s attempts: %s",
@@ -1193,7 +1669,9 @@ class SpotifyMusic(MusicService):
             except Exception:
                 if attempt == self._max_attempts:
                     raise
-                time.sleep(self._base_retry_delay * (2 ** (attempt - 1)))
+                time.sleep(
+                    min(self._base_retry_delay * (2 ** (attempt - 1)), self._max_retry_delay)
+                )
 
     def get_tracks(self, force_full_sync: bool) -> List[dict]:
         results = self._execute_with_retry(
@@ -1208,19 +1686,22 @@ class SpotifyMusic(MusicService):
             if results["next"]:
                 results = self._execute_with_retry(
                     "Fetch next page of Spotify saved tracks",
-                    lambda: self.client.next(results),
+                    functools.partial(self.client.next, results),
                 )
             else:
                 break
 
         return tracks
 
+    @_memoize_search
     def search_track(self, artist: str, title: str) -> Optional[dict]:
         query = f"{artist} {title}"
-        results = self.client.search(q=query, type="track", limit=1)
-        if results["tracks"]["items"]:
-            return results["tracks"]["items"][0]
-        return None
+        results = self._execute_with_retry(
+            f"Search Spotify track '{query}'",
+            functools.partial(self.client.search, q=query, type="track", limit=1),
+        )
+        items = ((results or {}).get("tracks") or {}).get("items") or []
+        return items[0] if items else None
 
     def add_track(self, track: dict) -> Optional[str]:
         if not self._check_duplicate(track.artists[0].name, track.title):
@@ -1228,10 +1709,11 @@ class SpotifyMusic(MusicService):
             if spotify_track:
                 self._execute_with_retry(
                     f"Add track to Spotify ({spotify_track['id']})",
-                    lambda: self.client.current_user_saved_tracks_add(
-                        [spotify_track["id"]]
+                    functools.partial(
+                        self.client.current_user_saved_tracks_add, [spotify_track["id"]]
                     ),
                 )
+                self._ensure_saved_index().add(self._saved_track_key(spotify_track))
                 return spotify_track["id"]
             else:
                 logger.warning(
@@ -1243,49 +1725,101 @@ class SpotifyMusic(MusicService):
             )
         return None
 
+    @staticmethod
+    def _duplicate_key(artist: Optional[str], title: Optional[str]) -> Tuple[str, str]:
+        return normalize_text(artist), normalize_text(title)
+
+    @classmethod
+    def _saved_track_key(cls, track: dict) -> Tuple[str, str]:
+        artists = track.get("artists") or [{}]
+        return cls._duplicate_key(artists[0].get("name"), track.get("name"))
+
+    def _fetch_saved_tracks_page(self, offset: int) -> dict:
+        return self._execute_with_retry(
+            f"Fetch Spotify saved tracks offset={offset}",
+            functools.partial(
+                self.client.current_user_saved_tracks,
+                limit=_SPOTIFY_SAVED_TRACKS_PAGE_SIZE,
+                offset=offset,
+            ),
+        ) or {}
+
+    def _ensure_saved_index(self) -> set:
+        if self._saved_track_keys is not None:
+            return self._saved_track_keys
+        # Индекс строит один поток; остальные параллельные add_track ждут его.
+        with self._saved_index_lock:
+            if self._saved_track_keys is not None:
+                return self._saved_track_keys
+            first_page = self._fetch_saved_tracks_page(0)
+            pages: Iterable[dict] = [first_page]
+            if first_page.get("next"):
+                # По total запрашиваем остальные страницы параллельно.
+                offsets = range(
+                    _SPOTIFY_SAVED_TRACKS_PAGE_SIZE,
+                    first_page.get("total") or 0,
+                    _SPOTIFY_SAVED_TRACKS_PAGE_SIZE,
+                )
+                with ThreadPoolExecutor(
+                    max_workers=_SPOTIFY_PAGE_WORKERS,
+                    thread_name_prefix="spotify-saved-tracks",
+                ) as executor:
+                    pages = [first_page, *executor.map(self._fetch_saved_tracks_page, offsets)]
+            self._saved_track_keys = {
+                self._saved_track_key(item["track"])
+                for page in pages
+                for item in page.get("items") or []
+                if item.get("track")
+            }
+        return self._saved_track_keys
+
     def _check_duplicate(self, artist: str, title: str) -> bool:
-        results = self.client.search(
-            q=f"track:{title} artist:{artist}", type="track", limit=50
-        )
-        for item in results["tracks"]["items"]:
-            if (
-                item["name"].lower() == title.lower()
-                and item["artists"][0]["name"].lower() == artist.lower()
-            ):
-                if self.client.current_user_saved_tracks_contains([item["id"]])[0]:
-                    return True
-        return False
+        return self._duplicate_key(artist, title) in self._ensure_saved_index()
 
     def remove_duplicates(self):
-        offset = 0
         limit = 50
-        tracks_seen = set()
-        tracks_to_remove = []
 
-        while True:
-            results = self.client.current_user_saved_tracks(limit=limit, offset=offset)
-            if len(results["items"]) == 0:
-                break
+        def fetch(offset: int) -> dict:
+            return self._execute_with_retry(
+                f"Fetch Spotify saved tracks offset={offset}",
+                functools.partial(self.client.current_user_saved_tracks, limit=limit, offset=offset),
+            ) or {}
 
-            for item in results["items"]:
-                track = item["track"]
-                key = (track["name"].lower(), track["artists"][0]["name"].lower())
+        def delete(batch_ids: List[str]) -> int:
+            self._execute_with_retry(
+                "Delete duplicate tracks batch in Spotify",
+                functools.partial(self.client.current_user_saved_tracks_delete, batch_ids),
+            )
+            return len(batch_ids)
 
-                if key in tracks_seen:
-                    tracks_to_remove.append(track["id"])
-                else:
-                    tracks_seen.add(key)
+        tracks_seen = set()
+        tracks_to_remove = []
 
-            offset += limit
+        with ThreadPoolExecutor(
+            max_workers=_SPOTIFY_PAGE_WORKERS,
+            thread_name_prefix="spotify-dedupe",
+        ) as executor:
+            first_page = fetch(0)
+            # По total запрашиваем остальные страницы параллельно; map сохраняет порядок.
+            offsets = range(limit, first_page.get("total") or 0, limit)
+            for page in [first_page, *executor.map(fetch, offsets)]:
+                for item in page.get("items") or []:
+                    track = item.get("track") or {}
+                    if not track.get("id") or not track.get("artists"):
+                        continue
+                    key = (track["name"].lower(), track["artists"][0]["name"].lower())
 
-        if tracks_to_remove:
-            for i in range(0, len(tracks_to_remove), 50):
-                batch = tracks_to_remove[i : i + 50]
-                self._execute_with_retry(
-                    "Delete duplicate tracks batch in Spotify",
-                    lambda batch_ids=batch: self.client.current_user_saved_tracks_delete(batch_ids),
-                )
-                logger.info(f"Removed {len(batch)} duplicate tracks from Spotify")
+                    if key in tracks_seen:
+                        tracks_to_remove.append(track["id"])
+                    else:
+                        tracks_seen.add(key)
+
+            batches = [
+                tracks_to_remove[i : i + limit]
+                for i in range(0, len(tracks_to_remove), limit)
+            ]
+            for removed in executor.map(delete, batches):
+                logger.info(f"Removed {removed} duplicate tracks from Spotify")
 
     def get_playlists(
         self,
@@ -1296,79 +1830,169 @@ class SpotifyMusic(MusicService):
         limit = 50
         playlists: List[PlaylistSnapshot] = []
 
-        while True:
-            response = self._execute_with_retry(
-                f"Fetch Spotify playlists offset={offset}",
-                lambda off=offset: self.client.current_user_playlists(
-                    limit=limit, offset=off
-                ),
-            )
-            items = response.get("items", [])
-            if not items:
-                break
+        with ThreadPoolExecutor(
+            max_workers=_SPOTIFY_PAGE_WORKERS,
+            thread_name_prefix="spotify-pages",
+        ) as executor:
+            while True:
+                response = self._execute_with_retry(
+                    f"Fetch Spotify playlists offset={offset}",
+                    functools.partial(
+                        self.client.current_user_playlists, limit=limit, offset=offset
+                    ),
+                )
+                items = response.get("items", [])
+                if not items:
+                    break
+
+                for playlist in items:
+                    snapshot = self._build_playlist_snapshot(
+                        playlist, include_followed, executor
+                    )
+                    if snapshot:
+                        playlists.append(snapshot)
+
+                offset += len(items)
+                if not response.get("next"):
+                    break
+
+            known_ids = {p.playlist_id for p in playlists}
+            extra_ids = [
+                playlist_id
+                for playlist_id in dict.fromkeys(
+                    raw_id.strip()
+                    for raw_id in os.getenv("SPOTIFY_EXTRA_PLAYLIST_IDS", "").split(",")
+                )
+                if playlist_id and playlist_id not in known_ids
+            ]
+
+            def _fetch_extra(playlist_id: str) -> Optional[dict]:
+                try:
+                    return self._execute_with_retry(
+                        f"Fetch Spotify playlist {playlist_id}",
+                        functools.partial(self.client.playlist, playlist_id),
+                    )
+                except SpotifyException as exc:
+                    logger.error(
+                        "Не удалось получить дополнительный плейлист %s: %s",
+                        playlist_id,
+                        exc,
+                    )
+                    return None
 
-            for playlist in items:
-                snapshot = self._build_playlist_snapshot(playlist, include_followed)
+            # Метаданные дополнительных плейлистов запрашиваем параллельно, а снимки
+            # собираем в этом потоке: их страницы используют тот же пул.
+            for playlist_data in list(executor.map(_fetch_extra, extra_ids)):
+                if not playlist_data:
+                    continue
+
+                snapshot = self._build_playlist_snapshot(
+                    playlist_data, include_followed=True, executor=executor
+                )
                 if snapshot:
                     playlists.append(snapshot)
 
-            offset += len(items)
-            if not response.get("next"):
-                break
+        return playlists
 
-        extra_ids_raw = os.getenv("SPOTIFY_EXTRA_PLAYLIST_IDS", "")
-        for raw_id in extra_ids_raw.split(","):
-            playlist_id = raw_id.strip()
-            if not playlist_id:
-                continue
-            if any(p.playlist_id == playlist_id for p in playlists):
-                continue
-            try:
-                playlist_data = self._execute_with_retry(
-                    f"Fetch Spotify playlist {playlist_id}",
-                    lambda pid=playlist_id: self.client.playlist(pid),
+    def library_fingerprint(
+        self, playlists: bool, albums: bool, artists: bool
+    ) -> Tuple[Any, ...]:
+        """Дешёвый слепок состояния библиотеки: меняется, когда меняются данные."""
+
+        def _head(description: str, func: Callable[[], Any], section: Optional[str] = None):
+            page = self._execute_with_retry(description, func) or {}
+            if section:
+                page = page.get(section) or {}
+            items = page.get("items") or []
+            first = items[0] if items else {}
+            first_id = (first.get("track") or first.get("album") or first).get("id")
+            return page.get("total"), first_id
+
+        parts: List[Any] = [
+            (
+                "tracks",
+                _head(
+                    "Fetch Spotify saved tracks head",
+                    functools.partial(self.client.current_user_saved_tracks, limit=1),
+                ),
+            )
+        ]
+        if playlists:
+            # snapshot_id меняется при любой правке плейлиста, поэтому обходим все страницы.
+            snapshots: List[Tuple[Any, Any]] = []
+            total = None
+            offset = 0
+            while True:
+                page = self._execute_with_retry(
+                    f"Fetch Spotify playlists snapshots offset={offset}",
+                    functools.partial(
+                        self.client.current_user_playlists, limit=50, offset=offset
+                    ),
+                ) or {}
+                items = page.get("items") or []
+                total = page.get("total", total)
+                snapshots.extend((item.get("id"), item.get("snapshot_id")) for item in items)
+                if not items or not page.get("next"):
+                    break
+                offset += len(items)
+            parts.append(("playlists", total, tuple(snapshots)))
+        if albums:
+            parts.append(
+                (
+                    "albums",
+                    _head(
+                        "Fetch Spotify saved albums head",
+                        functools.partial(self.client.current_user_saved_albums, limit=1),
+                    ),
                 )
-            except SpotifyException as exc:
-                logger.error(
-                    "Не удалось получить дополнительный плейлист %s: %s",
-                    playlist_id,
-                    exc,
+            )
+        if artists:
+            parts.append(
+                (
+                    "artists",
+                    _head(
+                        "Fetch Spotify followed artists head",
+                        functools.partial(self.client.current_user_followed_artists, limit=1),
+                        section="artists",
+                    ),
                 )
-                continue
-
-            if not playlist_data:
-                continue
-
-            snapshot = self._build_playlist_snapshot(playlist_data, include_followed=True)
-            if snapshot:
-                playlists.append(snapshot)
+            )
+        return tuple(parts)
 
-        return playlists
+    def _fetch_saved_albums_page(self, offset: int) -> dict:
+        return self._execute_with_retry(
+            f"Fetch Spotify saved albums offset={offset}",
+            functools.partial(
+                self.client.current_user_saved_albums,
+                limit=_SPOTIFY_SAVED_ALBUMS_PAGE_SIZE,
+                offset=offset,
+            ),
+        ) or {}
 
     def get_favorite_albums(self) -> List[FavoriteAlbum]:
         favorites: List[FavoriteAlbum] = []
-        offset = 0
-        limit = 50
-        while True:
-            response = self._execute_with_retry(
-                f"Fetch Spotify saved albums offset={offset}",
-                lambda off=offset: self.client.current_user_saved_albums(
-                    limit=limit, offset=off
-                ),
+        first_page = self._fetch_saved_albums_page(0)
+        pages: Iterable[dict] = [first_page]
+        if first_page.get("next"):
+            # По total запрашиваем остальные страницы параллельно; map сохраняет порядок.
+            offsets = range(
+                _SPOTIFY_SAVED_ALBUMS_PAGE_SIZE,
+                first_page.get("total") or 0,
+                _SPOTIFY_SAVED_ALBUMS_PAGE_SIZE,
             )
-            items = response.get("items", [])
-            if not items:
-                break
-            for item in items:
+            with ThreadPoolExecutor(
+                max_workers=_SPOTIFY_PAGE_WORKERS,
+                thread_name_prefix="spotify-albums",
+            ) as executor:
+                pages = [first_page, *executor.map(self._fetch_saved_albums_page, offsets)]
+
+        for response in pages:
+            for item in response.get("items", []):
                 album_data = item.get("album") or {}
                 album_id = album_data.get("id")
                 if not album_id:
                     continue
-                artist_name = ", ".join(
-                    artist.get("name")
-                    for artist in album_data.get("artists", [])
-                    if artist.get("name")
-                ) or None
+                artist_name = _join_spotify_artist_names(album_data.get("artists"))
                 favorites.append(
                     FavoriteAlbum(
                         service="spotify",
@@ -1378,12 +2002,9 @@ class SpotifyMusic(MusicService):
                         last_seen=_parse_datetime(item.get("added_at")),
                     )
                 )
-            offset += len(items)
-            if not response.get("next"):
-                break
         return favorites
 
-    def ensure_album_in_library(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
+    def resolve_album(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
         query_parts = []
         if album.name:
             query_parts.append(f"album:{album.name}")
@@ -1396,45 +2017,64 @@ class SpotifyMusic(MusicService):
 
         search = self._execute_with_retry(
             f"Search Spotify album '{query}'",
-            lambda: self.client.search(q=query, type="album", limit=5),
+            functools.partial(
+                self.client.search, q=query, type="album", limit=_SPOTIFY_SEARCH_LIMIT
+            ),
         )
         albums_data = (search or {}).get("albums", {})
         target_key = album_key(album)
+        best: Optional[FavoriteAlbum] = None
+        best_score = 0.0
         for candidate in albums_data.get("items", []):
             candidate_album = FavoriteAlbum(
                 service="spotify",
                 album_id=candidate.get("id"),
                 name=candidate.get("name"),
-                artist=", ".join(
-                    artist.get("name")
-                    for artist in candidate.get("artists", [])
-                    if artist.get("name")
-                ) or None,
+                artist=_join_spotify_artist_names(candidate.get("artists")),
                 last_seen=_now_utc(),
             )
             if candidate_album.album_id is None:
                 continue
             if target_key and album_key(candidate_album) != target_key:
+                score = album_similarity(album, candidate_album)
+                if score >= _FUZZY_MATCH_THRESHOLD and score > best_score:
+                    best, best_score = candidate_album, score
                 continue
+            return candidate_album
 
-            self._execute_with_retry(
-                f"Add Spotify album {candidate_album.album_id}",
-                lambda: self.client.current_user_saved_albums_add(
-                    [candidate_album.album_id]
-                ),
-            )
+        if best:
             logger.info(
-                "Добавлен альбом в Spotify: %s — %s",
-                candidate_album.artist,
-                candidate_album.name,
+                "Альбом в Spotify найден по похожести %.2f: %s — %s",
+                best_score,
+                best.artist,
+                best.name,
             )
-            return candidate_album
+            return best
 
         logger.warning(
             "Не удалось найти альбом в Spotify по запросу '%s'", query
         )
         return None
 
+    def add_albums(self, albums: Sequence[FavoriteAlbum]) -> List[FavoriteAlbum]:
+        unique = list({album.album_id: album for album in albums}.values())
+        for start in range(0, len(unique), _SPOTIFY_ALBUM_WRITE_BATCH_SIZE):
+            batch = unique[start : start + _SPOTIFY_ALBUM_WRITE_BATCH_SIZE]
+            ids = [album.album_id for album in batch]
+            self._execute_with_retry(
+                f"Add {len(ids)} Spotify albums",
+                functools.partial(self.client.current_user_saved_albums_add, ids),
+            )
+            for album in batch:
+                logger.info("Добавлен альбом в Spotify: %s — %s", album.artist, album.name)
+        return unique
+
+    def ensure_album_in_library(self, album: FavoriteAlbum) -> Optional[FavoriteAlbum]:
+        resolved = self.resolve_album(album)
+        if resolved:
+            self.add_albums([resolved])
+        return resolved
+
     def get_favorite_artists(self) -> List[FavoriteArtist]:
         favorites: List[FavoriteArtist] = []
         after: Optional[str] = None
@@ -1442,8 +2082,8 @@ class SpotifyMusic(MusicService):
         while True:
             response = self._execute_with_retry(
                 f"Fetch Spotify followed artists after={after}",
-                lambda cursor=after: self.client.current_user_followed_artists(
-                    limit=limit, after=cursor
+                functools.partial(
+                    self.client.current_user_followed_artists, limit=limit, after=after
                 ),
             )
             artists_data = (response or {}).get("artists", {})
@@ -1467,7 +2107,7 @@ class SpotifyMusic(MusicService):
                 break
         return favorites
 
-    def ensure_artist_followed(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
+    def resolve_artist(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
         query = artist.name
         if not query:
             logger.debug("Skipping Spotify artist ensure: missing name for %s", artist)
@@ -1475,10 +2115,14 @@ class SpotifyMusic(MusicService):
 
         search = self._execute_with_retry(
             f"Search Spotify artist '{query}'",
-            lambda: self.client.search(q=query, type="artist", limit=5),
+            functools.partial(
+                self.client.search, q=query, type="artist", limit=_SPOTIFY_SEARCH_LIMIT
+            ),
         )
         artists_data = (search or {}).get("artists", {})
         target_key = artist_key(artist)
+        best: Optional[FavoriteArtist] = None
+        best_score = 0.0
         for candidate in artists_data.get("items", []):
             candidate_artist = FavoriteArtist(
                 service="spotify",
@@ -1489,16 +2133,19 @@ class SpotifyMusic(MusicService):
             if candidate_artist.artist_id is None:
                 continue
             if target_key and artist_key(candidate_artist) != target_key:
+                score = artist_similarity(artist, candidate_artist)
+                if score >= _FUZZY_MATCH_THRESHOLD and score > best_score:
+                    best, best_score = candidate_artist, score
                 continue
+            return candidate_artist
 
-            self._execute_with_retry(
-                f"Follow Spotify artist {candidate_artist.artist_id}",
-                lambda: self.client.user_follow_artists(
-                    [candidate_artist.artist_id]
-                ),
+        if best:
+            logger.info(
+                "Исполнитель в Spotify найден по похожести %.2f: %s",
+                best_score,
+                best.name,
             )
-            logger.info("Добавлен исполнитель в Spotify: %s", candidate_artist.name)
-            return candidate_artist
+            return best
 
         logger.warning(
             "Не удалось найти исполнителя в Spotify по запросу '%s'",
@@ -1506,6 +2153,25 @@ class SpotifyMusic(MusicService):
         )
         return None
 
+    def follow_artists(self, artists: Sequence[FavoriteArtist]) -> List[FavoriteArtist]:
+        unique = list({artist.artist_id: artist for artist in artists}.values())
+        for start in range(0, len(unique), _LIBRARY_WRITE_BATCH_SIZE):
+            batch = unique[start : start + _LIBRARY_WRITE_BATCH_SIZE]
+            ids = [artist.artist_id for artist in batch]
+            self._execute_with_retry(
+                f"Follow {len(ids)} Spotify artists",
+                functools.partial(self.client.user_follow_artists, ids),
+            )
+            for artist in batch:
+                logger.info("Добавлен исполнитель в Spotify: %s", artist.name)
+        return unique
+
+    def ensure_artist_followed(self, artist: FavoriteArtist) -> Optional[FavoriteArtist]:
+        resolved = self.resolve_artist(artist)
+        if resolved:
+            self.follow_artists([resolved])
+        return resolved
+
 
 class MusicSynchronizer:
     def __init__(
@@ -1515,6 +2181,23 @@ class MusicSynchronizer:
     ):
         self.yandex = yandex_service
         self.spotify = spotify_service
+        # (сервис, id источника) -> найденная пара в другом сервисе. Живёт между
+        # циклами, чтобы не искать заново то, что уже сопоставили.
+        self._album_links: Dict[Tuple[str, str], FavoriteAlbum] = {}
+        self._artist_links: Dict[Tuple[str, str], FavoriteArtist] = {}
+
+    def change_fingerprint(
+        self, playlists: bool, albums: bool, artists: bool
+    ) -> Optional[Tuple[Any, ...]]:
+        """Слепок обеих библиотек или None, если получить его не удалось."""
+        try:
+            return (
+                self.spotify.library_fingerprint(playlists, albums, artists),
+                self.yandex.library_fingerprint(playlists, albums, artists),
+            )
+        except Exception as exc:
+            logger.warning("Не удалось проверить изменения в библиотеках: %s", exc)
+            return None
 
     def sync_tracks(
         self,
@@ -1524,8 +2207,17 @@ class MusicSynchronizer:
         if target in {"both", "spotify"}:
             logger.info("Синхронизация треков из Yandex в Spotify")
             yandex_tracks = self.yandex.get_tracks(force_full_sync)
-            for track in yandex_tracks:
-                spotify_id = self.spotify.add_track(track)
+            # Поиск и добавление упираются в сеть; map сохраняет порядок для логов.
+            with ThreadPoolExecutor(
+                max_workers=_TRACK_SYNC_WORKERS, thread_name_prefix="track-sync"
+            ) as executor:
+                results = list(
+                    executor.map(
+                        functools.partial(self._add_track_safely, self.spotify, "Spotify"),
+                        yandex_tracks,
+                    )
+                )
+            for track, spotify_id in zip(yandex_tracks, results):
                 if spotify_id:
                     logger.info(
                         "Добавлен трек в Spotify: %s - %s",
@@ -1540,14 +2232,24 @@ class MusicSynchronizer:
 
         if target in {"both", "yandex"}:
             logger.info("Синхронизация треков из Spotify в Yandex")
-            spotify_tracks = self.spotify.get_tracks(force_full_sync)
-            for item in spotify_tracks:
-                track = item["track"]
-                yandex_id = self.yandex.add_track(item)
+            spotify_tracks = [
+                item for item in self.spotify.get_tracks(force_full_sync) if item.get("track")
+            ]
+            with ThreadPoolExecutor(
+                max_workers=_TRACK_SYNC_WORKERS, thread_name_prefix="track-sync"
+            ) as executor:
+                results = list(
+                    executor.map(
+                        functools.partial(self._add_track_safely, self.yandex, "Yandex"),
+                        spotify_tracks,
+                    )
+                )
+            for item, yandex_id in zip(spotify_tracks, results):
                 if yandex_id:
+                    track = item["track"]
                     logger.info(
                         "Добавлен трек в Yandex: %s - %s",
-                        track["artists"][0]["name"],
+                        _join_spotify_artist_names(track.get("artists")),
                         track["name"],
                     )
         else:
@@ -1556,6 +2258,15 @@ class MusicSynchronizer:
                 target,
             )
 
+    @staticmethod
+    def _add_track_safely(service: MusicService, service_name: str, track: Any) -> Optional[str]:
+        # Ошибка одного трека не должна останавливать весь этап синхронизации.
+        try:
+            return service.add_track(track)
+        except Exception as exc:
+            logger.error("Не удалось добавить трек в %s: %s", service_name, exc)
+            return None
+
     def remove_duplicates(self):
         self.spotify.remove_duplicates()
         self.yandex.remove_duplicates()
@@ -1570,6 +2281,8 @@ class MusicSynchronizer:
             normalize_text(playlist.name or playlist.playlist_id): playlist
             for playlist in existing_yandex
         }
+        # Один и тот же трек Spotify часто встречается в нескольких плейлистах.
+        resolve_cache: Dict[str, Optional[Tuple[str, str, str]]] = {}
 
         for playlist in spotify_playlists:
             if not playlist.is_owned:
@@ -1611,16 +2324,19 @@ class MusicSynchronizer:
                 logger.error("Не удалось очистить плейлист '%s': %s", playlist.name, exc)
                 continue
 
-            additions = 0
+            resolved_tracks: List[Tuple[str, str]] = []
             for spotify_track in playlist.tracks:
                 if not spotify_track.track_id:
                     continue
 
-                resolved = self.yandex.resolve_track_for_playlist(
-                    spotify_track.track_id,
-                    spotify_track.title,
-                    spotify_track.artist,
-                )
+                resolved = resolve_cache.get(spotify_track.track_id, _MISSING)
+                if resolved is _MISSING:
+                    resolved = self.yandex.resolve_track_for_playlist(
+                        spotify_track.track_id,
+                        spotify_track.title,
+                        spotify_track.artist,
+                    )
+                    resolve_cache[spotify_track.track_id] = resolved
                 if not resolved:
                     logger.warning(
                         "Пропускаю трек при синхронизации плейлиста '%s': %s — %s",
@@ -1630,27 +2346,12 @@ class MusicSynchronizer:
                     )
                     continue
 
-                track_part, album_part, composite = resolved
-                try:
-                    updated_playlist = self.yandex.insert_track_into_playlist(
-                        yandex_playlist,
-                        track_part,
-                        album_part,
-                        at=len(getattr(yandex_playlist, "tracks", []) or []),
-                    )
-                except Exception as exc:
-                    logger.error(
-                        "Ошибка добавления трека %s — %s в плейлист '%s': %s",
-                        spotify_track.artist,
-                        spotify_track.title,
-                        playlist.name,
-                        exc,
-                    )
-                    continue
+                track_part, album_part, _composite = resolved
+                resolved_tracks.append((track_part, album_part))
 
-                if updated_playlist:
-                    yandex_playlist = updated_playlist
-                additions += 1
+            yandex_playlist, additions = self.yandex.insert_tracks_into_playlist(
+                yandex_playlist, resolved_tracks
+            )
 
             if additions:
                 logger.info(
@@ -1699,22 +2400,28 @@ class MusicSynchronizer:
             return
 
         if target in {"both", "spotify"}:
-            for album in diff.left_only:
-                logger.info(
-                    "Добавление альбома в Spotify: %s — %s",
-                    album.artist,
-                    album.name,
+            logger.info("Добавление %s альбомов в Spotify", len(diff.left_only))
+            self.spotify.add_albums(
+                self._resolve_missing(
+                    diff.left_only,
+                    self.spotify.resolve_album,
+                    self._album_links,
+                    {album.album_id for album in spotify_albums},
+                    lambda album: album.album_id,
                 )
-                self.spotify.ensure_album_in_library(album)
+            )
 
         if target in {"both", "yandex"}:
-            for album in diff.right_only:
-                logger.info(
-                    "Добавление альбома в Yandex: %s — %s",
-                    album.artist,
-                    album.name,
+            logger.info("Добавление %s альбомов в Yandex", len(diff.right_only))
+            self.yandex.add_albums(
+                self._resolve_missing(
+                    diff.right_only,
+                    self.yandex.resolve_album,
+                    self._album_links,
+                    {album.album_id for album in yandex_albums},
+                    lambda album: album.album_id,
                 )
-                self.yandex.ensure_album_in_library(album)
+            )
 
     def sync_favorite_artists(self, readonly: bool, target: str) -> None:
         yandex_artists = self.yandex.get_favorite_artists()
@@ -1738,14 +2445,88 @@ class MusicSynchronizer:
             return
 
         if target in {"both", "spotify"}:
-            for artist in diff.left_only:
-                logger.info("Добавление исполнителя в Spotify: %s", artist.name)
-                self.spotify.ensure_artist_followed(artist)
+            logger.info("Добавление %s исполнителей в Spotify", len(diff.left_only))
+            self.spotify.follow_artists(
+                self._resolve_missing(
+                    diff.left_only,
+                    self.spotify.resolve_artist,
+                    self._artist_links,
+                    {artist.artist_id for artist in spotify_artists},
+                    lambda artist: artist.artist_id,
+                )
+            )
 
         if target in {"both", "yandex"}:
-            for artist in diff.right_only:
-                logger.info("Добавление исполнителя в Yandex: %s", artist.name)
-                self.yandex.ensure_artist_followed(artist)
+            logger.info("Добавление %s исполнителей в Yandex", len(diff.right_only))
+            self.yandex.follow_artists(
+                self._resolve_missing(
+                    diff.right_only,
+                    self.yandex.resolve_artist,
+                    self._artist_links,
+                    {artist.artist_id for artist in yandex_artists},
+                    lambda artist: artist.artist_id,
+                )
+            )
+
+    @staticmethod
+    def _resolve_missing(
+        missing: Sequence[Any],
+        resolver: Callable[[Any], Optional[Any]],
+        links: Dict[Tuple[str, str], Any],
+        present_ids: set,
+        entity_id: Callable[[Any], str],
+    ) -> List[Any]:
+        """Находит пары для отсутствующих сущностей, переиспользуя прошлые сопоставления.
+
+        Сопоставление, найденное приблизительно, не совпадает по ключу с исходной
+        сущностью, поэтому она попадает в diff на каждом цикле. Ссылка позволяет
+        не повторять поиск, а уже добавленные сущности просто пропустить.
+        """
+        pending: List[Any] = []
+        for entity in missing:
+            link_key = (entity.service, entity_id(entity))
+            resolved = links.get(link_key)
+            if resolved is None:
+                resolved = resolver(entity)
+                if resolved is None:
+                    continue
+                links[link_key] = resolved
+            if entity_id(resolved) not in present_ids:
+                pending.append(resolved)
+        return pending
+
+
+# Сколько треков ищем и добавляем одновременно при синхронизации библиотек.
+_TRACK_SYNC_WORKERS = 8
+# Предел адаптивной паузы между циклами без изменений.
+_MAX_IDLE_SLEEP_SECONDS = 900
+
+
+def _run_sync_phases(phases: Sequence[Tuple[str, Callable[[], None]]]) -> None:
+    """Запускает независимые этапы синхронизации параллельно.
+
+    Этапы обращаются к разным эндпоинтам и упираются в сеть, а не в CPU.
+    Ошибка одного этапа не прерывает остальные; первая из них пробрасывается
+    после завершения всех.
+    """
+    if not phases:
+        return
+
+    def _run(phase: Tuple[str, Callable[[], None]]) -> None:
+        message, func = phase
+        logger.info(message)
+        func()
+
+    with ThreadPoolExecutor(
+        max_workers=len(phases), thread_name_prefix="sync-phase"
+    ) as executor:
+        futures = [executor.submit(_run, phase) for phase in phases]
+
+    errors = [future.exception() for future in futures if future.exception()]
+    for error in errors[1:]:
+        logger.error("Этап синхронизации завершился с ошибкой: %s", error)
+    if errors:
+        raise errors[0]
 
 
 def parse_arguments():
@@ -1845,44 +2626,90 @@ def main():
         web_thread.start()
         logger.info("Веб-сервер запущен на порту 8888")
 
+    # Этапы и их параметры не меняются между циклами — собираем их один раз.
+    phases: List[Tuple[str, Callable[[], None]]] = [
+        (
+            "Синхронизация треков...",
+            functools.partial(
+                synchronizer.sync_tracks,
+                force_full_sync=args.force_full_sync,
+                target=args.track_sync_target,
+            ),
+        )
+    ]
+    if args.sync_playlists:
+        phases.append(
+            (
+                "Сбор снимков плейлистов...",
+                functools.partial(
+                    synchronizer.sync_playlists,
+                    force_full_sync=args.force_full_sync,
+                    include_followed_spotify=args.include_followed_playlists,
+                ),
+            )
+        )
+    if args.sync_favorite_albums:
+        phases.append(
+            (
+                "Синхронизация избранных альбомов...",
+                functools.partial(
+                    synchronizer.sync_favorite_albums,
+                    readonly=args.favorite_sync_readonly,
+                    target=args.favorite_sync_target,
+                ),
+            )
+        )
+    if args.sync_favorite_artists:
+        phases.append(
+            (
+                "Синхронизация избранных исполнителей...",
+                functools.partial(
+                    synchronizer.sync_favorite_artists,
+                    readonly=args.favorite_sync_readonly,
+                    target=args.favorite_sync_target,
+                ),
+            )
+        )
+
+    fingerprint = functools.partial(
+        synchronizer.change_fingerprint,
+        playlists=args.sync_playlists,
+        albums=args.sync_favorite_albums,
+        artists=args.sync_favorite_artists,
+    )
+    max_sleep = max(args.sleep, _MAX_IDLE_SLEEP_SECONDS)
+    sleep_for = args.sleep
+    last_fingerprint: Optional[Tuple[Any, ...]] = None
+
     try:
         first_run = True
         while True:
             try:
-                logger.info("Синхронизация треков...")
-                synchronizer.sync_tracks(
-                    force_full_sync=args.force_full_sync,
-                    target=args.track_sync_target,
-                )
-
-                if args.sync_playlists:
-                    logger.info("Сбор снимков плейлистов...")
-                    synchronizer.sync_playlists(
-                        force_full_sync=args.force_full_sync,
-                        include_followed_spotify=args.include_followed_playlists,
+                current = fingerprint()
+                unchanged = current is not None and current == last_fingerprint
+                # Пока ничего не меняется, пропускаем полные циклы и удлиняем паузу;
+                # на максимальной паузе всё равно делаем полный проход для надёжности.
+                if unchanged and sleep_for < max_sleep:
+                    sleep_for = min(sleep_for * 2, max_sleep)
+                    logger.info(
+                        "Изменений нет, следующая проверка через %s секунд", sleep_for
                     )
+                    time.sleep(sleep_for)
+                    continue
+                if not unchanged:
+                    sleep_for = args.sleep
 
-                if args.sync_favorite_albums:
-                    logger.info("Синхронизация избранных альбомов...")
-                    synchronizer.sync_favorite_albums(
-                        readonly=args.favorite_sync_readonly,
-                        target=args.favorite_sync_target,
-                    )
+                _run_sync_phases(phases)
 
-                if args.sync_favorite_artists:
-                    logger.info("Синхронизация избранных исполнителей...")
-                    synchronizer.sync_favorite_artists(
-                        readonly=args.favorite_sync_readonly,
-                        target=args.favorite_sync_target,
-                    )
-                
                 if first_run and args.remove_duplicates:
                     logger.info("Удаление дубликатов...")
                     synchronizer.remove_duplicates()
-                    first_run = False
-                
-                logger.info(f"Ожидание {args.sleep} секунд...")
-                time.sleep(args.sleep)
+                first_run = False
+
+                # Слепок после синхронизации учитывает и наши собственные изменения.
+                last_fingerprint = fingerprint()
+                logger.info(f"Ожидание {sleep_for} секунд...")
+                time.sleep(sleep_for)
             except Exception:
                 logger.exception("Произошла ошибка во время синхронизации")
                 logger.info("Ожидание 60 секунд перед повторной попыткой...")
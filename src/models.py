@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaylistTrack:
     track_id: str
     title: Optional[str] = None
@@ -15,7 +15,7 @@ class PlaylistTrack:
     added_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlaylistSnapshot:
     service: str
     playlist_id: str
@@ -26,7 +26,7 @@ class PlaylistSnapshot:
     is_owned: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FavoriteAlbum:
     service: str
     album_id: str
@@ -35,7 +35,7 @@ class FavoriteAlbum:
     last_seen: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FavoriteArtist:
     service: str
     artist_id: str
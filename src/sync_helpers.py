@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import difflib
+import functools
 import re
 from collections import defaultdict
 from dataclasses import dataclass
@@ -10,15 +12,17 @@ from .models import FavoriteAlbum, FavoriteArtist, PlaylistTrack
 _T = TypeVar("_T", FavoriteAlbum, FavoriteArtist)
 
 
-_normalize_pattern = re.compile(r"[^a-z0-9]+", re.IGNORECASE)
+# Любые символы, кроме букв и цифр (включая кириллицу), схлопываются в пробел.
+_normalize_pattern = re.compile(r"[\W_]+")
 
 
+@functools.lru_cache(maxsize=16384)
 def normalize_text(value: Optional[str]) -> str:
     if not value:
         return ""
-    lowered = value.lower()
-    simplified = _normalize_pattern.sub(" ", lowered)
-    return re.sub(r"\s+", " ", simplified).strip()
+    # Шаблон схлопывает любые пробелы вместе с прочими символами, поэтому
+    # повторных пробелов в результате не остаётся.
+    return _normalize_pattern.sub(" ", value.lower()).strip()
 
 
 def album_key(album: FavoriteAlbum) -> str:
@@ -33,6 +37,24 @@ def track_key(track: PlaylistTrack) -> str:
     return normalize_text(track.title)
 
 
+def text_similarity(left: Optional[str], right: Optional[str]) -> float:
+    left_norm = normalize_text(left)
+    right_norm = normalize_text(right)
+    if not left_norm or not right_norm:
+        return 0.0
+    return difflib.SequenceMatcher(None, left_norm, right_norm).ratio()
+
+
+def album_similarity(left: FavoriteAlbum, right: FavoriteAlbum) -> float:
+    return 0.5 * text_similarity(left.name, right.name) + 0.5 * text_similarity(
+        left.artist, right.artist
+    )
+
+
+def artist_similarity(left: FavoriteArtist, right: FavoriteArtist) -> float:
+    return text_similarity(left.name, right.name)
+
+
 @dataclass
 class EntityDiff:
     matched_pairs: List[Tuple[_T, _T]]
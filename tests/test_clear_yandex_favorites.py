@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "clear_yandex_favorites.py"
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("clear_yandex_favorites", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_fallback_dotenv_parser_keeps_first_value_and_existing_env(monkeypatch):
+    script = _load_script()
+    environ = {"PRESET": "env"}
+    monkeypatch.setattr(os, "environ", environ)
+
+    script._apply_dotenv_lines(
+        "# comment\r\n"
+        "X=1\r\n"
+        "X=2\r\n"
+        "not a pair\n"
+        "PRESET=file\n"
+        ' QUOTED = "a b" \n'
+        "MIXED='\"v\"'\n"
+    )
+
+    assert environ == {"PRESET": "env", "X": "1", "QUOTED": "a b", "MIXED": '"v"'}
@@ -52,6 +52,14 @@ def test_join_artist_names_filters_empty():
     assert main._join_artist_names(artists) == "Charlie"
 
 
+def test_join_spotify_artist_names_keeps_order_and_skips_empty():
+    artists = [{"name": "Zeta"}, {"name": ""}, {"id": "x"}, {"name": "Alpha"}]
+
+    assert main._join_spotify_artist_names(artists) == "Zeta, Alpha"
+    assert main._join_spotify_artist_names([]) is None
+    assert main._join_spotify_artist_names(None) is None
+
+
 def test_join_artist_names_all_empty():
     artists = [DummyArtist(None), DummyArtist("")]
     assert main._join_artist_names(artists) is None
@@ -63,6 +71,9 @@ def test_join_artist_names_all_empty():
     [
         ("Hello, World!", "hello world"),
         ("  Multiple   Spaces  ", "multiple spaces"),
+        ("Tab\tand\nnewline -- mix", "tab and newline mix"),
+        ("Кино – Группа крови", "кино группа крови"),
+        ("snake_case", "snake case"),
         ("", ""),
         (None, ""),
     ],
@@ -120,3 +131,87 @@ def test_match_entities_right_excess():
     assert diff.left_only == []
     assert len(diff.right_only) == 1
     assert diff.right_only[0].artist_id == "s2"
+
+
+def test_memoized_cache_handler_reads_file_once(tmp_path):
+    cache_file = tmp_path / ".cache"
+    cache_file.write_text('{"access_token": "first"}')
+    handler = main._MemoizedCacheFileHandler(cache_path=str(cache_file))
+
+    assert handler.get_cached_token() == {"access_token": "first"}
+    cache_file.unlink()
+    assert handler.get_cached_token() == {"access_token": "first"}
+
+    handler.save_token_to_cache({"access_token": "second"})
+    assert handler.get_cached_token() == {"access_token": "second"}
+    assert '"second"' in cache_file.read_text()
+
+
+def test_mount_pooled_adapter_keeps_retry_policy():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=3))
+
+    main._mount_pooled_adapter(session, pool_size=16)
+
+    adapter = session.get_adapter("https://api.spotify.com")
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 3
+
+
+def test_pooled_yandex_request_reuses_session(monkeypatch):
+    request = main._PooledYandexRequest()
+    response = type("Response", (), {"status_code": 200, "content": b"{}"})()
+    calls = []
+
+    def fake_request(*args, **kwargs):
+        calls.append(kwargs)
+        return response
+
+    monkeypatch.setattr(request._session, "request", fake_request)
+
+    assert request._request_wrapper("GET", "https://api.music.yandex.net/x", timeout=5) == b"{}"
+    assert calls[0]["headers"]["User-Agent"]
+
+
+@pytest.mark.parametrize("status_code", [200, 400, 401, 403, 404, 409, 413, 500, 502])
+def test_pooled_yandex_request_matches_library_error_mapping(monkeypatch, status_code):
+    from yandex_music.utils import request as yandex_request
+
+    response = type("Response", (), {"status_code": status_code, "content": b"{}"})()
+    pooled = main._PooledYandexRequest()
+    monkeypatch.setattr(pooled._session, "request", lambda *args, **kwargs: response)
+    library = yandex_request.Request()
+    monkeypatch.setattr(yandex_request.requests, "request", lambda *args, **kwargs: response)
+
+    def outcome(request):
+        try:
+            return request._request_wrapper("GET", "https://api.music.yandex.net/x", timeout=5)
+        except Exception as exc:  # noqa: BLE001 - compare exception types
+            return type(exc), str(exc)
+
+    assert outcome(pooled) == outcome(library)
+
+
+def test_check_and_fix_spotify_cache_converts_python_repr(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    token = {"access_token": "it's-a-token", "expires_at": 123}
+    (tmp_path / ".cache").write_text(repr(token))
+
+    main.check_and_fix_spotify_cache()
+
+    assert json.loads((tmp_path / ".cache").read_text()) == token
+
+
+def test_album_similarity_scores_close_variants():
+    original = FavoriteAlbum(service="yandex", album_id="1", name="Abbey Road", artist="The Beatles")
+    remaster = FavoriteAlbum(service="spotify", album_id="2", name="Abbey Road", artist="The Beatle")
+    other = FavoriteAlbum(service="spotify", album_id="3", name="Let It Be", artist="The Beatles")
+
+    assert sync_helpers.album_similarity(original, remaster) > 0.9
+    assert sync_helpers.album_similarity(original, other) < 0.9
+    assert sync_helpers.text_similarity("", "") == 0.0
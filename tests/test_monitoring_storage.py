@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from monitoring.storage import BULK_INSERT_CHUNK_SIZE, Metric, StateStore
+
+
+def test_save_metrics_small_batch(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    now = datetime.now(UTC)
+    store.save_metrics([Metric.from_value("cpu_percent", 10, now)])
+
+    samples = store.fetch_metric_window("cpu_percent", now - timedelta(minutes=1))
+    assert [sample.value for sample in samples] == ["10"]
+
+
+def test_save_metrics_bulk_batch_spans_chunks(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    now = datetime.now(UTC)
+    total = BULK_INSERT_CHUNK_SIZE + 7
+    metrics = [
+        Metric.from_value("cpu_percent", idx, now - timedelta(seconds=total - idx))
+        for idx in range(total)
+    ]
+
+    store.save_metrics(metrics)
+
+    samples = store.fetch_metric_window("cpu_percent", now - timedelta(hours=1))
+    assert len(samples) == total
+    assert [sample.value for sample in samples] == [str(idx) for idx in range(total)]
+
+
+def test_prune_metrics_older_than_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr("monitoring.storage.PRUNE_BATCH_SIZE", 3)
+    store = StateStore(tmp_path / "state.db")
+    now = datetime.now(UTC)
+    old = [Metric.from_value("cpu_percent", idx, now - timedelta(days=400, seconds=idx)) for idx in range(7)]
+    fresh = [Metric.from_value("cpu_percent", 99, now)]
+    store.save_metrics(old + fresh)
+
+    store.prune_metrics_older_than(now - timedelta(days=365))
+
+    samples = store.fetch_metric_window("cpu_percent", now - timedelta(days=1000))
+    assert [sample.value for sample in samples] == ["99"]
+
+
+def test_state_store_uses_wal_journal(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+
+    with store.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
+from monitoring import notifier
 from monitoring.config import Config
 from monitoring.notifier import (
+    _enqueue_status_command,
     _handle_status_command,
     _open_state_store,
     poll_telegram_subscribers,
@@ -145,6 +148,31 @@ def test_send_notifications_telegram_existing_subscribers(monkeypatch, tmp_path)
     assert sorted(sent) == ["101", "202"]
 
 
+def test_send_notifications_keeps_unchanged_subscriber_store(monkeypatch, tmp_path):
+    config = Config()
+    config.notification.telegram.enabled = True
+    config.notification.telegram.chat_ids = []
+    config.notification.telegram.token = "inline-token"
+    config.notification.telegram.poll_updates = True
+    store_path = tmp_path / "subs.json"
+    config.notification.telegram.subscriber_store = store_path
+
+    raw_state = json.dumps({"chat_ids": ["101"], "last_update_id": 7})
+    store_path.write_text(raw_state, encoding="utf-8")
+
+    def fake_urlopen(request, timeout):  # type: ignore[no-untyped-def]
+        url = request.full_url if hasattr(request, "full_url") else request.get_full_url()
+        if "getUpdates" in url:
+            return _ResponseStub({"ok": True, "result": []})
+        return _ResponseStub({"ok": True})
+
+    monkeypatch.setattr("monitoring.notifier.urllib.request.urlopen", fake_urlopen)
+
+    errors = send_notifications(config, [SimpleNamespace()], "Alert body")
+    assert errors == []
+    assert store_path.read_text(encoding="utf-8") == raw_state
+
+
 def test_send_notifications_telegram_with_alert(monkeypatch):
     config = Config()
     config.notification.telegram.enabled = True
@@ -167,6 +195,29 @@ def test_send_notifications_telegram_with_alert(monkeypatch):
     assert captured and captured[0]["chat_id"] == "4242"
 
 
+def test_send_notifications_telegram_broadcasts_to_all_chats(monkeypatch):
+    config = Config()
+    config.notification.telegram.enabled = True
+    config.notification.telegram.chat_ids = ["1", "2", "3"]
+    config.notification.telegram.token = "inline-token"
+
+    delivered = []
+
+    def fake_urlopen(request, timeout):  # type: ignore[no-untyped-def]
+        payload = json.loads(request.data.decode("utf-8"))
+        if payload["chat_id"] == "2":
+            return _ResponseStub({"ok": False, "description": "chat not found"})
+        delivered.append(payload["chat_id"])
+        return _ResponseStub({"ok": True})
+
+    monkeypatch.setattr("monitoring.notifier.urllib.request.urlopen", fake_urlopen)
+
+    errors = send_notifications(config, [SimpleNamespace()], "Alert body")
+
+    assert sorted(delivered) == ["1", "3"]
+    assert len(errors) == 1 and errors[0].startswith("telegram:")
+
+
 def test_send_notifications_missing_telegram_token(monkeypatch):
     config = Config()
     config.notification.telegram.enabled = True
@@ -286,6 +337,8 @@ def test_poll_telegram_subscribers_status_command(monkeypatch, tmp_path):
     monkeypatch.setattr("monitoring.notifier.urllib.request.urlopen", fake_urlopen)
 
     result = poll_telegram_subscribers(config)
+    # /status replies are delivered by the background worker.
+    notifier._STATUS_QUEUE.join()
 
     assert result is True
     assert actions[0] == "poll"
@@ -305,6 +358,69 @@ def test_poll_telegram_subscribers_status_command(monkeypatch, tmp_path):
     assert saved["last_update_id"] == 101
 
 
+def test_enqueue_status_command_runs_on_worker_thread(monkeypatch):
+    handled: list[tuple[str, str]] = []
+
+    def fake_handle(config, token, chat_id):  # type: ignore[no-untyped-def]
+        handled.append((threading.current_thread().name, chat_id))
+
+    monkeypatch.setattr(notifier, "_handle_status_command", fake_handle)
+
+    config = Config()
+    _enqueue_status_command(config, "token", "1")
+    _enqueue_status_command(config, "token", "2")
+
+    notifier._STATUS_QUEUE.join()
+    assert handled == [("telegram-status-worker", "1"), ("telegram-status-worker", "2")]
+
+
+def test_status_worker_exits_once_queue_is_drained(monkeypatch):
+    monkeypatch.setattr(notifier, "_handle_status_command", lambda config, token, chat_id: None)
+
+    _enqueue_status_command(Config(), "token", "1")
+    worker = notifier._STATUS_WORKER
+    assert worker is not None and not worker.daemon
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert notifier._STATUS_WORKER is None
+
+
+def test_poll_does_not_wait_for_hung_status_check(monkeypatch, tmp_path):
+    config = Config()
+    config.notification.telegram.enabled = True
+    config.notification.telegram.poll_updates = True
+    config.notification.telegram.token = "inline-token"
+    config.notification.telegram.subscriber_store = tmp_path / "subs.json"
+    config.notification.telegram.subscriber_store.write_text(
+        json.dumps({"chat_ids": ["515"], "last_update_id": 1}), encoding="utf-8"
+    )
+    release = threading.Event()
+
+    def hung_handle(config, token, chat_id):  # type: ignore[no-untyped-def]
+        release.wait(timeout=5)
+
+    def fake_urlopen(request, timeout):  # type: ignore[no-untyped-def]
+        return _ResponseStub(
+            {
+                "ok": True,
+                "result": [
+                    {"update_id": 2, "message": {"text": "/status", "chat": {"id": 515, "type": "private"}}}
+                ],
+            }
+        )
+
+    monkeypatch.setattr(notifier, "_handle_status_command", hung_handle)
+    monkeypatch.setattr("monitoring.notifier.urllib.request.urlopen", fake_urlopen)
+
+    try:
+        assert poll_telegram_subscribers(config) is True
+        assert notifier._STATUS_QUEUE.unfinished_tasks == 1
+    finally:
+        release.set()
+    notifier._STATUS_QUEUE.join()
+
+
 def test_open_state_store_fallback(monkeypatch, tmp_path):
     config = Config()
     primary_path = tmp_path / "no-access" / "state.db"
@@ -0,0 +1,294 @@
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from src.main import SpotifyMusic
+
+
+def make_spotify_music() -> SpotifyMusic:
+    instance = object.__new__(SpotifyMusic)
+    instance.client = MagicMock()
+    instance._max_attempts = 1
+    instance._base_retry_delay = 0.0
+    instance._current_user_id = "me"
+    instance._user_country = "RU"
+    instance._search_cache = OrderedDict()
+    instance._saved_track_keys = None
+    instance._saved_index_lock = threading.Lock()
+    instance._rate_limiter = None
+    instance._execute_with_retry = types.MethodType(
+        lambda self, description, func: func(), instance
+    )
+    return instance
+
+
+def _playlist_page(offset: int, total: int, limit: int = 100) -> dict:
+    items = [
+        {
+            "track": {
+                "id": f"t{idx}",
+                "name": f"Song {idx}",
+                "artists": [{"name": "Artist"}],
+            },
+            "added_at": None,
+        }
+        for idx in range(offset, min(offset + limit, total))
+    ]
+    return {
+        "items": items,
+        "total": total,
+        "next": "more" if offset + limit < total else None,
+    }
+
+
+def test_build_playlist_snapshot_fetches_pages_concurrently_in_order():
+    spotify = make_spotify_music()
+    total = 250
+    spotify.client.playlist_items.side_effect = (
+        lambda playlist_id, fields, offset, limit, additional_types: _playlist_page(offset, total, limit)
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        snapshot = spotify._build_playlist_snapshot(
+            {"id": "pl", "name": "Mix", "owner": {"id": "me"}},
+            include_followed=False,
+            executor=executor,
+        )
+
+    assert snapshot is not None
+    assert [track.track_id for track in snapshot.tracks] == [f"t{idx}" for idx in range(total)]
+    assert [track.position for track in snapshot.tracks] == list(range(total))
+    offsets = sorted(call.kwargs["offset"] for call in spotify.client.playlist_items.call_args_list)
+    assert offsets == [0, 100, 200]
+
+
+def test_build_playlist_snapshot_single_page_without_executor():
+    spotify = make_spotify_music()
+    spotify.client.playlist_items.return_value = _playlist_page(0, 3)
+
+    snapshot = spotify._build_playlist_snapshot(
+        {"id": "pl", "name": "Mix", "owner": {"id": "me"}},
+        include_followed=False,
+    )
+
+    assert snapshot is not None
+    assert len(snapshot.tracks) == 3
+    spotify.client.playlist_items.assert_called_once()
+    assert "next,total" in spotify.client.playlist_items.call_args.kwargs["fields"]
+
+
+def test_check_duplicate_uses_saved_tracks_index():
+    spotify = make_spotify_music()
+    saved = [("Song", "Artist")] * 50 + [("Other", "Band"), ("Группа крови", "Кино")]
+
+    def saved_page(limit, offset):
+        return {
+            "items": [
+                {"track": {"name": name, "artists": [{"name": artist}]}}
+                for name, artist in saved[offset : offset + limit]
+            ],
+            "total": len(saved),
+            "next": "more" if offset + limit < len(saved) else None,
+        }
+
+    spotify.client.current_user_saved_tracks.side_effect = saved_page
+
+    assert spotify._check_duplicate("artist", "SONG!")
+    assert spotify._check_duplicate("Band", "Other")
+    assert spotify._check_duplicate("КИНО", "группа крови")
+    assert not spotify._check_duplicate("Кино", "Звезда")
+    assert not spotify._check_duplicate("Artist", "Missing")
+    offsets = [call.kwargs["offset"] for call in spotify.client.current_user_saved_tracks.call_args_list]
+    assert offsets == [0, 50]
+    spotify.client.search.assert_not_called()
+
+
+def test_execute_with_retry_honors_retry_after(monkeypatch):
+    from spotipy.exceptions import SpotifyException
+
+    from src import main
+
+    spotify = object.__new__(SpotifyMusic)
+    spotify._rate_limiter = None
+    spotify._max_attempts = 2
+    spotify._base_retry_delay = 1.0
+    spotify._max_retry_delay = 8.0
+    sleeps = []
+    monkeypatch.setattr(main.time, "sleep", sleeps.append)
+
+    calls = iter([SpotifyException(429, -1, "rate limited", headers={"Retry-After": "3"}), "ok"])
+
+    def flaky():
+        outcome = next(calls)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert spotify._execute_with_retry("flaky call", flaky) == "ok"
+    assert sleeps == [3.0]
+
+
+def test_search_track_retries_rate_limits_with_retry_after(monkeypatch):
+    from spotipy.exceptions import SpotifyException
+
+    from src import main
+
+    spotify = make_spotify_music()
+    del spotify._execute_with_retry
+    spotify._max_attempts = 2
+    spotify._max_retry_delay = 8.0
+    sleeps = []
+    monkeypatch.setattr(main.time, "sleep", sleeps.append)
+    track = {"id": "t1", "name": "Song"}
+    spotify.client.search.side_effect = [
+        SpotifyException(429, -1, "rate limited", headers={"Retry-After": "2"}),
+        {"tracks": {"items": [track]}},
+    ]
+
+    assert spotify.search_track("Artist", "Song") == track
+    assert sleeps == [2.0]
+
+
+def test_execute_with_retry_does_not_retry_client_errors(monkeypatch):
+    from spotipy.exceptions import SpotifyException
+
+    from src import main
+
+    spotify = object.__new__(SpotifyMusic)
+    spotify._rate_limiter = None
+    spotify._max_attempts = 5
+    spotify._base_retry_delay = 1.0
+    spotify._max_retry_delay = 8.0
+    sleeps = []
+    monkeypatch.setattr(main.time, "sleep", sleeps.append)
+    failing = MagicMock(side_effect=SpotifyException(404, -1, "not found"))
+
+    try:
+        spotify._execute_with_retry("missing resource", failing)
+    except SpotifyException as exc:
+        assert exc.http_status == 404
+    else:  # pragma: no cover - the call must fail
+        raise AssertionError("SpotifyException was not raised")
+
+    assert failing.call_count == 1
+    assert sleeps == []
+
+
+def test_remove_duplicates_fetches_saved_pages_by_offset():
+    spotify = make_spotify_music()
+    total = 120
+
+    def saved_page(limit, offset):
+        items = [
+            {
+                "track": {
+                    "id": f"t{idx}",
+                    "name": "Song" if idx in (10, 110) else f"Song {idx}",
+                    "artists": [{"name": "Artist"}],
+                }
+            }
+            for idx in range(offset, min(offset + limit, total))
+        ]
+        return {"items": items, "total": total}
+
+    spotify.client.current_user_saved_tracks.side_effect = saved_page
+
+    spotify.remove_duplicates()
+
+    offsets = sorted(call.kwargs["offset"] for call in spotify.client.current_user_saved_tracks.call_args_list)
+    assert offsets == [0, 50, 100]
+    spotify.client.current_user_saved_tracks_delete.assert_called_once_with(["t110"])
+
+
+def test_get_favorite_albums_fetches_remaining_pages_by_offset():
+    spotify = make_spotify_music()
+    total = 120
+
+    def saved_albums(limit, offset):
+        items = [
+            {"album": {"id": f"a{idx}", "name": f"Album {idx}", "artists": [{"name": "Band"}]}}
+            for idx in range(offset, min(offset + limit, total))
+        ]
+        return {"items": items, "total": total, "next": "more" if offset + limit < total else None}
+
+    spotify.client.current_user_saved_albums.side_effect = saved_albums
+
+    albums = spotify.get_favorite_albums()
+
+    assert [album.album_id for album in albums] == [f"a{idx}" for idx in range(total)]
+    offsets = sorted(call.kwargs["offset"] for call in spotify.client.current_user_saved_albums.call_args_list)
+    assert offsets == [0, 50, 100]
+
+
+def test_get_playlists_fetches_extra_playlists_once(monkeypatch):
+    spotify = make_spotify_music()
+    monkeypatch.setenv("SPOTIFY_EXTRA_PLAYLIST_IDS", "x1, x2,x1,")
+    spotify.client.current_user_playlists.return_value = {"items": [], "next": None}
+    spotify.client.playlist.side_effect = lambda pid: {"id": pid, "name": pid, "owner": {"id": "other"}}
+    spotify.client.playlist_items.return_value = _playlist_page(0, 1)
+
+    playlists = spotify.get_playlists(force_full_sync=True)
+
+    assert [playlist.playlist_id for playlist in playlists] == ["x1", "x2"]
+    assert spotify.client.playlist.call_count == 2
+
+
+def test_add_albums_writes_in_batches_of_twenty():
+    from src.models import FavoriteAlbum
+
+    spotify = make_spotify_music()
+    albums = [
+        FavoriteAlbum(service="spotify", album_id=f"a{idx % 120}", name="A", artist="B", last_seen=None)
+        for idx in range(125)
+    ]
+
+    added = spotify.add_albums(albums)
+
+    assert len(added) == 120
+    sizes = [len(call.args[0]) for call in spotify.client.current_user_saved_albums_add.call_args_list]
+    assert sizes == [20] * 6
+
+
+def test_library_fingerprint_pages_through_all_playlists():
+    spotify = make_spotify_music()
+    spotify.client.current_user_saved_tracks.return_value = {"items": [], "total": 0}
+    snapshots = {f"p{idx}": "s1" for idx in range(60)}
+
+    def playlists_page(limit, offset):
+        ids = list(snapshots)[offset : offset + limit]
+        return {
+            "items": [{"id": pid, "snapshot_id": snapshots[pid]} for pid in ids],
+            "total": len(snapshots),
+            "next": "more" if offset + limit < len(snapshots) else None,
+        }
+
+    spotify.client.current_user_playlists.side_effect = playlists_page
+
+    first = spotify.library_fingerprint(playlists=True, albums=False, artists=False)
+    snapshots["p55"] = "s2"
+
+    assert spotify.library_fingerprint(playlists=True, albums=False, artists=False) != first
+    offsets = [call.kwargs["offset"] for call in spotify.client.current_user_playlists.call_args_list]
+    assert offsets == [0, 50, 0, 50]
+
+
+def test_library_fingerprint_changes_with_saved_tracks():
+    spotify = make_spotify_music()
+    spotify.client.current_user_saved_tracks.return_value = {
+        "items": [{"track": {"id": "t1"}}],
+        "total": 10,
+    }
+    spotify.client.current_user_followed_artists.return_value = {
+        "artists": {"items": [{"id": "ar1"}], "total": 3}
+    }
+
+    first = spotify.library_fingerprint(playlists=False, albums=False, artists=True)
+    assert first == (("tracks", (10, "t1")), ("artists", (3, "ar1")))
+
+    spotify.client.current_user_saved_tracks.return_value = {
+        "items": [{"track": {"id": "t2"}}],
+        "total": 11,
+    }
+    assert spotify.library_fingerprint(playlists=False, albums=False, artists=True) != first
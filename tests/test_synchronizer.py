@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src import main
+from src.models import FavoriteAlbum, PlaylistSnapshot, PlaylistTrack
+
+
+def test_token_bucket_waits_when_empty(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(main.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(main.time, "sleep", fake_sleep)
+    bucket = main._TokenBucket(rate=2.0, capacity=2.0)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_run_sync_phases_runs_every_phase_and_reraises_first_error():
+    calls = []
+
+    def ok():
+        calls.append("ok")
+
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        main._run_sync_phases([("first", boom), ("second", ok), ("third", ok)])
+
+    assert calls == ["ok", "ok"]
+
+
+def test_sync_favorite_albums_reuses_links_between_cycles():
+    source = FavoriteAlbum(service="yandex", album_id="y1", name="Album", artist="Band")
+    fallback = FavoriteAlbum(service="spotify", album_id="s1", name="Album (Deluxe)", artist="Band")
+    yandex, spotify = MagicMock(), MagicMock()
+    yandex.get_favorite_albums.return_value = [source]
+    spotify.get_favorite_albums.return_value = []
+    spotify.resolve_album.return_value = fallback
+    synchronizer = main.MusicSynchronizer(yandex, spotify)
+
+    synchronizer.sync_favorite_albums(readonly=False, target="spotify")
+    spotify.get_favorite_albums.return_value = [fallback]
+    synchronizer.sync_favorite_albums(readonly=False, target="spotify")
+
+    spotify.resolve_album.assert_called_once_with(source)
+    assert [call.args[0] for call in spotify.add_albums.call_args_list] == [[fallback], []]
+
+
+def test_playlist_sync_resolves_shared_tracks_once():
+    yandex, spotify = MagicMock(), MagicMock()
+    yandex.resolve_track_for_playlist.return_value = ("1", "2", "1:2")
+    yandex.insert_tracks_into_playlist.return_value = (MagicMock(), 1)
+    shared = PlaylistTrack(track_id="sp1", title="Song", artist="Artist")
+    playlists = [
+        PlaylistSnapshot(service="spotify", playlist_id=pid, name=pid, owner="me", tracks=[shared])
+        for pid in ("first", "second")
+    ]
+
+    main.MusicSynchronizer(yandex, spotify)._sync_spotify_playlists_to_yandex(playlists, [])
+
+    yandex.resolve_track_for_playlist.assert_called_once_with("sp1", "Song", "Artist")
+    assert yandex.insert_tracks_into_playlist.call_count == 2
+
+
+def test_sync_tracks_adds_spotify_items_concurrently():
+    yandex, spotify = MagicMock(), MagicMock()
+    items = [{"track": {"id": f"t{idx}", "name": f"Song {idx}", "artists": [{"name": "A"}]}} for idx in range(20)]
+    spotify.get_tracks.return_value = items + [{"track": None}]
+    yandex.add_track.side_effect = lambda item: item["track"]["id"]
+
+    main.MusicSynchronizer(yandex, spotify).sync_tracks(target="yandex")
+
+    assert sorted(call.args[0]["track"]["id"] for call in yandex.add_track.call_args_list) == sorted(
+        item["track"]["id"] for item in items
+    )
+
+
+def test_sync_tracks_skips_failed_track_and_keeps_going():
+    yandex, spotify = MagicMock(), MagicMock()
+    tracks = [MagicMock(title=f"Song {idx}") for idx in range(5)]
+    yandex.get_tracks.return_value = tracks
+
+    def add_track(track):
+        if track is tracks[2]:
+            raise RuntimeError("boom")
+        return track.title
+
+    spotify.add_track.side_effect = add_track
+
+    main.MusicSynchronizer(yandex, spotify).sync_tracks(target="spotify")
+
+    assert spotify.add_track.call_count == 5
@@ -1,4 +1,6 @@
+import threading
 import types
+from collections import OrderedDict
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -12,6 +14,11 @@ def make_yandex_music() -> YandexMusic:
     instance.client = MagicMock()
     instance._max_attempts = 1
     instance._base_retry_delay = 0.0
+    instance._search_cache = OrderedDict()
+    instance._album_id_cache = {}
+    instance._playlist_index = None
+    instance._album_inflight = {}
+    instance._album_inflight_lock = threading.Lock()
     instance._execute_with_retry = types.MethodType(
         lambda self, description, func: func(), instance
     )
@@ -178,4 +185,86 @@ def test_clear_playlist_tracks_handles_wrong_revision_retry():
     assert first_call.args[0] == 1019
     assert second_call.kwargs == {"from_": 0, "to": 1, "revision": 11}
     assert second_call.args[0] == 1019
-    assert result is cleared_playlist
\ No newline at end of file
+    assert result is cleared_playlist
+
+
+def test_get_playlists_fetches_tracks_for_every_playlist_in_order():
+    yandex = make_yandex_music()
+    playlists = []
+    for kind in range(1, 9):
+        playlist = build_playlist(
+            playlist_id=str(kind),
+            kind=kind,
+            tracks=[],
+            title=f"Playlist {kind}",
+        )
+        fetched = simple_track(f"Song {kind}", "Artist")
+        fetched.track.id = kind
+        fetched.track.albums = [SimpleNamespace(id=f"album-{kind}")]
+        playlist.fetch_tracks = MagicMock(return_value=[fetched])
+        playlist.modified = None
+        playlists.append(playlist)
+    yandex.client.users_playlists_list.return_value = playlists
+
+    snapshots = yandex.get_playlists(force_full_sync=True)
+
+    assert [snapshot.playlist_id for snapshot in snapshots] == [str(kind) for kind in range(1, 9)]
+    assert all(playlist.fetch_tracks.call_count == 1 for playlist in playlists)
+    assert [snapshot.tracks[0].title for snapshot in snapshots] == [f"Song {kind}" for kind in range(1, 9)]
+    assert yandex._album_id_cache["3"] == "album-3"
+
+
+def test_ensure_playlist_lists_once_and_indexes_created_playlists():
+    yandex = make_yandex_music()
+    existing = SimpleNamespace(title="Road Trip", kind=3)
+    yandex.client.users_playlists_list.return_value = [existing]
+    yandex.client.users_playlists_create.return_value = SimpleNamespace(title="New", kind=9)
+    yandex.fetch_playlist = MagicMock(side_effect=lambda kind: SimpleNamespace(kind=int(kind)))
+
+    assert yandex.ensure_playlist("road trip").kind == 3
+    assert yandex.ensure_playlist("New").kind == 9
+    assert yandex.ensure_playlist("new").kind == 9
+
+    yandex.client.users_playlists_list.assert_called_once()
+    yandex.client.users_playlists_create.assert_called_once()
+
+
+def test_insert_tracks_into_playlist_sends_one_bulk_change():
+    import json
+
+    yandex = make_yandex_music()
+    playlist = SimpleNamespace(kind=5, revision=3, tracks=[object(), object()])
+    updated = SimpleNamespace(kind=5, revision=4, tracks=[])
+    yandex.client.users_playlists_change.return_value = updated
+
+    result, added = yandex.insert_tracks_into_playlist(playlist, [("1", "a"), ("2", "b")])
+
+    assert (result, added) == (updated, 2)
+    kind, diff, revision = yandex.client.users_playlists_change.call_args.args
+    assert (kind, revision) == (5, 3)
+    assert json.loads(diff) == [
+        {"op": "insert", "at": 2, "tracks": [{"id": "1", "albumId": "a"}, {"id": "2", "albumId": "b"}]}
+    ]
+
+
+def test_insert_tracks_into_playlist_falls_back_to_single_inserts():
+    yandex = make_yandex_music()
+    playlist = SimpleNamespace(kind=5, revision=1, tracks=[object(), object()])
+    yandex.client.users_playlists_change.side_effect = YandexMusicError("wrong-revision")
+    positions = []
+
+    def fake_insert(playlist_obj, track_id, album_id, at=None):
+        if track_id == "bad":
+            raise YandexMusicError("boom")
+        positions.append(at)
+        return playlist_obj
+
+    yandex.insert_track_into_playlist = fake_insert
+
+    result, added = yandex.insert_tracks_into_playlist(
+        playlist, [("1", "a"), ("bad", "b"), ("2", "c")]
+    )
+
+    assert result is playlist
+    assert added == 2
+    assert positions == [2, 3]
@@ -1,4 +1,6 @@
+import threading
 import types
+from collections import OrderedDict
 from unittest.mock import MagicMock
 
 from typing import Any, Optional
@@ -11,6 +13,11 @@ def make_yandex_music() -> YandexMusic:
     instance.client = MagicMock()
     instance._max_attempts = 1
     instance._base_retry_delay = 0.0
+    instance._search_cache = OrderedDict()
+    instance._album_id_cache = {}
+    instance._playlist_index = None
+    instance._album_inflight = {}
+    instance._album_inflight_lock = threading.Lock()
     instance._execute_with_retry = types.MethodType(
         lambda self, description, func: func(),
         instance,
@@ -138,3 +145,92 @@ def test_search_track_returns_best_track_even_if_mismatch():
     result = yandex.search_track("Target Artist", "Right Song")
 
     assert result["id"] == "111"
+
+
+def test_prefetch_album_ids_batches_and_caches():
+    yandex = make_yandex_music()
+    yandex.client.tracks.side_effect = lambda ids: [DummyTrack(tid, f"a{tid}") for tid in ids]
+
+    yandex._prefetch_album_ids(str(idx) for idx in range(60))
+
+    assert [len(call.args[0]) for call in yandex.client.tracks.call_args_list] == [50, 10]
+    assert yandex._get_album_id_for_track("7") == "a7"
+    assert yandex.client.tracks.call_count == 2
+
+
+def test_remove_duplicates_batches_metadata_lookup():
+    yandex = make_yandex_music()
+    likes = [types.SimpleNamespace(track_id=f"{idx}:a{idx}") for idx in range(55)]
+    yandex.client.users_likes_tracks.return_value = likes
+    yandex.client.tracks.side_effect = lambda ids: [
+        DummyTrack(tid, f"a{tid}", title="Song" if tid in {"3", "52"} else f"Song {tid}", artists=["Artist"])
+        for tid in ids
+    ]
+
+    yandex.remove_duplicates()
+
+    assert [len(call.args[0]) for call in yandex.client.tracks.call_args_list] == [50, 5]
+    yandex.client.users_likes_tracks_remove.assert_called_once_with(["52:a52"])
+
+
+def test_get_album_id_for_track_deduplicates_inflight_requests():
+    from concurrent.futures import ThreadPoolExecutor
+
+    yandex = make_yandex_music()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_tracks(ids):
+        started.set()
+        release.wait(timeout=5)
+        return [DummyTrack(tid, "album-1") for tid in ids]
+
+    yandex.client.tracks.side_effect = slow_tracks
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(yandex._get_album_id_for_track, "42") for _ in range(4)]
+        assert started.wait(timeout=5)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["album-1"] * 4
+    assert yandex.client.tracks.call_count == 1
+
+
+def test_search_track_cache_distinguishes_cyrillic_queries():
+    yandex = make_yandex_music()
+    kino = {"id": "1:1", "albums": [{"id": "1"}]}
+    mumiy = {"id": "2:2", "albums": [{"id": "2"}]}
+    yandex.client.search.side_effect = [{"tracks": [kino]}, {"tracks": [mumiy]}]
+
+    assert yandex.search_track("Кино", "Группа крови") == kino
+    assert yandex.search_track("Мумий Тролль", "Утекай") == mumiy
+    assert yandex.search_track("КИНО", "группа крови") == kino
+    assert yandex.client.search.call_count == 2
+
+
+def test_search_track_caches_found_results_by_normalized_key():
+    yandex = make_yandex_music()
+    track_payload = {"id": "5:6", "albums": [{"id": "6"}]}
+    yandex.client.search.return_value = {"tracks": [track_payload]}
+
+    assert yandex.search_track("Artist", "Song") == track_payload
+    assert yandex.search_track("  artist ", "SONG") == track_payload
+    assert yandex.client.search.call_count == 1
+
+    yandex.client.search.return_value = None
+    assert yandex.search_track("Artist", "Missing") is None
+    assert yandex.search_track("Artist", "Missing") is None
+    assert yandex.client.search.call_count == 3
+
+
+def test_get_tracks_fetches_likes_in_batches_preserving_order():
+    yandex = make_yandex_music()
+    likes = [types.SimpleNamespace(track_id=f"{idx}:a{idx}") for idx in reversed(range(60))]
+    yandex.client.users_likes_tracks.return_value = likes
+    yandex.client.tracks.side_effect = lambda ids: [DummyTrack(tid, f"a{tid}") for tid in reversed(ids)]
+
+    tracks = yandex.get_tracks(force_full_sync=False)
+
+    assert [track.id for track in tracks] == [str(idx) for idx in reversed(range(60))]
+    assert [len(call.args[0]) for call in yandex.client.tracks.call_args_list] == [50, 10]